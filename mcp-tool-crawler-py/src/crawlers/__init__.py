@@ -8,16 +8,23 @@ This package contains crawlers for different types of sources:
 """
 
 from enum import Enum
-from typing import Type
+from typing import Dict, Type
 
 from ..models import Source, SourceType
+from .base import BaseCrawler
 from .github_awesome_list import GitHubAwesomeListCrawler
 
 
 class CrawlerTypes(Enum):
     """Enum for crawler types."""
     GITHUB_AWESOME_LIST = GitHubAwesomeListCrawler
-    
+
+
+# Crawler class for each source type; add more crawler types here as they are implemented
+CRAWLERS_BY_TYPE: Dict[SourceType, Type[BaseCrawler]] = {
+    SourceType.GITHUB_AWESOME_LIST: GitHubAwesomeListCrawler,
+}
+
 
 def get_crawler_for_source(source: Source):
     """
@@ -32,9 +39,8 @@ def get_crawler_for_source(source: Source):
     Raises:
         ValueError: If no crawler is available for the source type.
     """
-    if source.type == SourceType.GITHUB_AWESOME_LIST:
-        return GitHubAwesomeListCrawler(source)
+    crawler_class = CRAWLERS_BY_TYPE.get(source.type)
+    if crawler_class is None:
+        raise ValueError(f"No crawler available for source type: {source.type}")
     
-    # Add more crawler types here as they are implemented
-        
-    raise ValueError(f"No crawler available for source type: {source.type}")
+    return crawler_class(source)
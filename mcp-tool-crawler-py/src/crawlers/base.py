@@ -35,7 +35,8 @@ class BaseCrawler(ABC):
         Returns:
             A CrawlResult object.
         """
-        start_time = time.time()
+        # Monotonic integer clock: immune to wall-clock jumps and no float math
+        start_ns = time.perf_counter_ns()
         logger.info(f"Starting crawl for source: {self.source.name} ({self.source.url})")
         
         try:
@@ -43,7 +44,7 @@ class BaseCrawler(ABC):
             discovered_tools = self.discover_tools()
             
             # Calculate results
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             result = CrawlResult(
                 source_id=self.source.id,
@@ -62,7 +63,7 @@ class BaseCrawler(ABC):
             logger.error(f"Error crawling {self.source.name}: {str(e)}")
             
             # Calculate duration even in case of error
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             result = CrawlResult(
                 source_id=self.source.id,
@@ -35,7 +35,7 @@ def initialize_sources_handler(event, context):
         sources = asyncio.run(source_manager.initialize_sources())
         
         # Convert to JSON-serializable format
-        sources_json = [source.dict() for source in sources]
+        sources_json = [source.model_dump(mode='json') for source in sources]
         
         logger.info(f"Initialized {len(sources)} sources")
         
@@ -77,7 +77,7 @@ def get_sources_to_crawl_handler(event, context):
         sources = asyncio.run(source_manager.get_sources_to_crawl(time_threshold_hours))
         
         # Convert to JSON-serializable format
-        sources_json = [source.dict() for source in sources]
+        sources_json = [source.model_dump(mode='json') for source in sources]
         
         logger.info(f"Found {len(sources)} sources to crawl")
         
@@ -120,7 +120,7 @@ def crawl_source_handler(event, context):
         result = asyncio.run(crawler_service.crawl_source(source))
         
         # Convert to JSON-serializable format
-        result_json = result.dict()
+        result_json = result.model_dump(mode='json')
         
         logger.info(f"Crawl completed for source {source.name}: {result.tools_discovered} tools discovered")
         
@@ -167,13 +167,16 @@ def crawl_all_sources_handler(event, context):
         results = asyncio.run(crawler_service.crawl_all_sources(force, concurrency))
         
         # Convert to JSON-serializable format
-        results_json = [result.dict() for result in results]
-        
-        # Calculate summary
-        success_count = sum(1 for result in results if result.success)
-        total_tools = sum(result.tools_discovered for result in results if result.success)
-        new_tools = sum(result.new_tools for result in results if result.success)
-        updated_tools = sum(result.updated_tools for result in results if result.success)
+        results_json = [result.model_dump(mode='json') for result in results]
+        
+        # Calculate summary in a single pass
+        success_count = total_tools = new_tools = updated_tools = 0
+        for result in results:
+            if result.success:
+                success_count += 1
+                total_tools += result.tools_discovered
+                new_tools += result.new_tools
+                updated_tools += result.updated_tools
         
         logger.info(f"Crawl all sources completed: {success_count}/{len(results)} successful")
         
@@ -13,10 +13,19 @@ from typing import List, Dict, Any
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Import S3 client
 s3_client = boto3.client('s3')
 dynamodb = boto3.resource('dynamodb')
 
+# Source types that have a dedicated crawler
+KNOWN_CRAWLER_TYPES = frozenset({'github_awesome_list', 'github_repository'})
+
 def load_sources_from_s3(bucket_name: str, source_list_key: str) -> List[Dict[str, Any]]:
     """
     Load sources from S3 YAML file.
@@ -46,8 +55,8 @@ def load_sources_from_s3(bucket_name: str, source_list_key: str) -> List[Dict[st
         )
         
         # Parse YAML
-        content = response['Body'].read().decode('utf-8')
-        data = yaml.safe_load(content)
+        content = response['Body'].read()
+        data = yaml.load(content, Loader=YamlLoader)
         sources_data = data.get('sources', [])
         
         logger.info(f"Loaded {len(sources_data)} sources from S3 bucket: {bucket_name}/{source_list_key}")
@@ -94,7 +103,7 @@ def initialize_sources(event):
                     
                     # Set has_known_crawler based on type if not provided
                     if 'has_known_crawler' not in source and 'type' in source:
-                        source['has_known_crawler'] = source['type'] in ['github_awesome_list', 'github_repository']
+                        source['has_known_crawler'] = source['type'] in KNOWN_CRAWLER_TYPES
                     
                     # Save to DynamoDB
                     table.put_item(Item=source)
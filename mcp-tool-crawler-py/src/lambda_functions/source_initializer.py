@@ -7,7 +7,6 @@ import logging
 import boto3
 import asyncio
 import sys
-import os
 from pathlib import Path
 
 # Add the parent directory to sys.path to import from the src directory
@@ -36,17 +35,17 @@ async def initialize_sources(event):
         
         if s3_bucket_name and s3_source_list_key:
             logger.info(f"Initializing sources from S3: s3://{s3_bucket_name}/{s3_source_list_key}")
-            # These will be used by the source manager to determine where to load sources from
-            os.environ['S3_BUCKET_NAME'] = s3_bucket_name
-            os.environ['S3_SOURCE_LIST_KEY'] = s3_source_list_key
         else:
             logger.info("No S3 information provided, using default configuration")
             
         # Initialize the source manager
         source_manager = SourceManager()
         
-        # Initialize sources (this will try S3 first if the env vars are set)
-        sources = await source_manager.initialize_sources()
+        # Initialize sources, loading the S3 source list first if one was given
+        sources = await source_manager.initialize_sources(
+            s3_bucket_name=s3_bucket_name,
+            s3_source_list_key=s3_source_list_key,
+        )
         
         return {
             'sourceCount': len(sources),
@@ -7,7 +7,7 @@ import argparse
 import sys
 from typing import List, Dict, Any
 
-from .models import Source, SourceType
+from .models import Source, SOURCE_TYPE_ALIASES
 from .services.crawler_service import CrawlerService
 from .services.source_manager import SourceManager
 from .utils.logging import get_logger
@@ -50,13 +50,13 @@ async def add_source(url, name=None, source_type=None):
     
     # Convert string source type to enum if provided
     if source_type and isinstance(source_type, str):
-        try:
-            source_type = SourceType(source_type.lower())
-        except ValueError:
-            valid_types = ", ".join([t.value for t in SourceType])
+        parsed_type = SOURCE_TYPE_ALIASES.get(source_type.lower())
+        if parsed_type is None:
+            valid_types = ", ".join(SOURCE_TYPE_ALIASES)
             print(f"Invalid source type: {source_type}")
             print(f"Valid types: {valid_types}")
             return
+        source_type = parsed_type
     
     # Add the source
     source = await source_manager.add_source_by_url(url, name, source_type)
@@ -69,11 +69,8 @@ async def crawl_source(source_id):
     source_manager = SourceManager()
     crawler_service = CrawlerService()
     
-    # Get all sources
-    sources = await source_manager.get_all_sources()
-    
     # Find the source by ID
-    source = next((s for s in sources if s.id == source_id), None)
+    source = await source_manager.get_source(source_id)
     
     if not source:
         print(f"Source with ID {source_id} not found")
@@ -131,8 +128,7 @@ async def crawl_all(force=False, concurrency=None):
         print("\nFailed Sources:")
         for result in results:
             if not result.success:
-                source = next((s for s in await source_manager.get_all_sources() 
-                              if s.id == result.source_id), None)
+                source = await source_manager.get_source(result.source_id)
                 if source:
                     print(f"- {source.name} ({source.url}): {result.error}")
 
@@ -1,9 +1,15 @@
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from datetime import datetime
 from uuid import uuid4, UUID
 from pydantic import BaseModel, Field, HttpUrl, field_validator, ConfigDict
 
+# Prefer orjson's C parser when it's installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class SourceType(str, Enum):
     GITHUB_AWESOME_LIST = "github_awesome_list"
@@ -13,6 +19,53 @@ class SourceType(str, Enum):
     MANUALLY_ADDED = "manually_added"
 
 
+# Lookup table for parsing source types from strings
+SOURCE_TYPES_BY_VALUE: Dict[str, SourceType] = {t.value: t for t in SourceType}
+
+# Source type names accepted in source lists, including short aliases
+SOURCE_TYPE_ALIASES: Dict[str, SourceType] = {
+    **SOURCE_TYPES_BY_VALUE,
+    'awesome': SourceType.GITHUB_AWESOME_LIST,
+    'repo': SourceType.GITHUB_REPOSITORY,
+    'site': SourceType.WEBSITE,
+}
+
+# Bound once, since model defaults call it for every tool and crawl result
+_utcnow = datetime.utcnow
+
+
+def _utc_timestamp() -> str:
+    """
+    Get the current UTC time as a naive ISO timestamp.
+    
+    Returns:
+        Current UTC timestamp in ISO format.
+    """
+    return _utcnow().isoformat()
+
+
+def _load_metadata(data: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode a metadata column.
+    
+    Most rows hold the empty object written for sources and tools without
+    metadata, so those skip the JSON parser.
+    
+    Args:
+        data: Column value.
+        
+    Returns:
+        The metadata dictionary.
+    """
+    if not data or data == '{}':
+        return {}
+    return json_loads(data)
+
+
+# Source types we have a predefined crawler for
+KNOWN_CRAWLER_TYPES = frozenset({SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY})
+
+
 class Source(BaseModel):
     """Model representing a source of MCP tools"""
     model_config = ConfigDict(validate_assignment=True)
@@ -36,6 +89,42 @@ class Source(BaseModel):
     @classmethod
     def set_defaults(cls, v):
         return v if v is not None else None
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Source":
+        """
+        Build a source from a database row without re-running validation.
+        
+        Rows are written from validated sources, so only the column
+        conversions are done here.
+        
+        Args:
+            row: Row of the SOURCE_ROW_COLUMNS columns, in that order.
+            
+        Returns:
+            The source stored in the row.
+        """
+        (source_id, url, name, source_type, has_known_crawler,
+         crawler_id, last_crawled, last_crawl_status, metadata) = row
+        
+        return cls.model_construct(
+            id=source_id,
+            url=url,
+            name=name,
+            type=SOURCE_TYPES_BY_VALUE[source_type],
+            has_known_crawler=bool(has_known_crawler),
+            crawler_id=crawler_id,
+            last_crawled=last_crawled,
+            last_crawl_status=last_crawl_status,
+            metadata=_load_metadata(metadata),
+        )
+
+
+# Columns Source.from_row expects, in order
+SOURCE_ROW_COLUMNS = (
+    'id', 'url', 'name', 'type', 'has_known_crawler',
+    'crawler_id', 'last_crawled', 'last_crawl_status', 'metadata',
+)
 
 
 class MCPTool(BaseModel):
@@ -49,11 +138,56 @@ class MCPTool(BaseModel):
     # URL to the source where this tool was discovered
     source_url: str
     # When this tool was first discovered
-    first_discovered: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    first_discovered: str = Field(default_factory=_utc_timestamp)
     # When this tool was last updated
-    last_updated: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_updated: str = Field(default_factory=_utc_timestamp)
     # Optional metadata
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "MCPTool":
+        """
+        Build a tool from a database row without re-running validation.
+        
+        Args:
+            row: Row of the TOOL_ROW_COLUMNS columns, in that order.
+            
+        Returns:
+            The tool stored in the row.
+        """
+        (tool_id, name, description, url, source_url,
+         first_discovered, last_updated, metadata) = row
+        
+        return cls.model_construct(
+            id=tool_id,
+            name=name,
+            description=description,
+            url=url,
+            source_url=source_url,
+            first_discovered=first_discovered,
+            last_updated=last_updated,
+            metadata=_load_metadata(metadata),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the tool's fields as a plain dictionary.
+        
+        Every field already holds a JSON type, so this reads the values
+        directly instead of going through pydantic's generic serializer.
+        
+        Returns:
+            Dictionary of the tool's fields.
+        """
+        values = self.__dict__
+        return {field: values[field] for field in TOOL_ROW_COLUMNS}
+
+
+# Columns MCPTool.from_row expects, in order
+TOOL_ROW_COLUMNS = (
+    'id', 'name', 'description', 'url', 'source_url',
+    'first_discovered', 'last_updated', 'metadata',
+)
 
 
 class CrawlerStrategy(BaseModel):
@@ -68,9 +202,40 @@ class CrawlerStrategy(BaseModel):
     # The AI-generated description of what this crawler does
     description: str
     # When this crawler was created
-    created: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created: str = Field(default_factory=_utc_timestamp)
     # When this crawler was last modified
-    last_modified: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_modified: str = Field(default_factory=_utc_timestamp)
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "CrawlerStrategy":
+        """
+        Build a crawler strategy from a database row without re-running validation.
+        
+        Args:
+            row: Row of the CRAWLER_STRATEGY_ROW_COLUMNS columns, in that order.
+            
+        Returns:
+            The crawler strategy stored in the row.
+        """
+        (strategy_id, source_id, source_type, implementation, description,
+         created, last_modified) = row
+        
+        return cls.model_construct(
+            id=strategy_id,
+            source_id=source_id,
+            source_type=SOURCE_TYPES_BY_VALUE[source_type],
+            implementation=implementation,
+            description=description,
+            created=created,
+            last_modified=last_modified,
+        )
+
+
+# Columns CrawlerStrategy.from_row expects, in order
+CRAWLER_STRATEGY_ROW_COLUMNS = (
+    'id', 'source_id', 'source_type', 'implementation', 'description',
+    'created', 'last_modified',
+)
 
 
 class CrawlResult(BaseModel):
@@ -78,10 +243,42 @@ class CrawlResult(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
     
     source_id: str
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_utc_timestamp)
     success: bool
     tools_discovered: int
     new_tools: int
     updated_tools: int
     duration: int  # milliseconds
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "CrawlResult":
+        """
+        Build a crawl result from a database row without re-running validation.
+        
+        Args:
+            row: Row of the CRAWL_RESULT_ROW_COLUMNS columns, in that order.
+            
+        Returns:
+            The crawl result stored in the row.
+        """
+        (source_id, timestamp, success, tools_discovered, new_tools,
+         updated_tools, duration, error) = row
+        
+        return cls.model_construct(
+            source_id=source_id,
+            timestamp=timestamp,
+            success=bool(success),
+            tools_discovered=tools_discovered,
+            new_tools=new_tools,
+            updated_tools=updated_tools,
+            duration=duration,
+            error=error,
+        )
+
+
+# Columns CrawlResult.from_row expects, in order
+CRAWL_RESULT_ROW_COLUMNS = (
+    'source_id', 'timestamp', 'success', 'tools_discovered', 'new_tools',
+    'updated_tools', 'duration', 'error',
+)
@@ -3,7 +3,7 @@ Crawler orchestration service for MCP tool crawler.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..models import Source, MCPTool, CrawlResult
 from ..crawlers import get_crawler_for_source
@@ -15,6 +15,9 @@ from ..storage import get_storage
 logger = get_logger(__name__)
 config = get_config()
 
+# Crawls recorded per last-crawl save, so a crash loses at most one batch
+LAST_CRAWL_BATCH_SIZE = 20
+
 
 class CrawlerService:
     """
@@ -28,12 +31,14 @@ class CrawlerService:
         self.source_manager = get_source_manager()
         self.storage = get_storage()
     
-    async def crawl_source(self, source: Source) -> CrawlResult:
+    async def crawl_source(self, source: Source, update_last_crawl: bool = True) -> CrawlResult:
         """
         Crawl a specific source.
         
         Args:
             source: Source to crawl.
+            update_last_crawl: Whether to record the crawl on the source. Batch
+                               callers pass False and record crawls in batches.
             
         Returns:
             A CrawlResult object.
@@ -48,14 +53,16 @@ class CrawlerService:
             result = crawler.execute()
             
             # Update the source's last crawl time
-            await self.source_manager.update_source_last_crawl(source.id, result.success)
+            if update_last_crawl:
+                await self.source_manager.update_source_last_crawl(source.id, result.success)
             
             return result
         except Exception as e:
             logger.error(f"Error crawling source {source.name}: {str(e)}")
             
             # Update the source's last crawl time
-            await self.source_manager.update_source_last_crawl(source.id, False)
+            if update_last_crawl:
+                await self.source_manager.update_source_last_crawl(source.id, False)
             
             # Return a failure result
             return CrawlResult(
@@ -94,31 +101,56 @@ class CrawlerService:
         
         logger.info(f"Crawling {len(sources)} sources with concurrency {concurrency}")
         
-        # Create tasks for each source
-        tasks = []
-        semaphore = asyncio.Semaphore(concurrency)
+        # Queue the sources for a fixed pool of workers, followed by one stop sentinel per worker
+        worker_count = min(concurrency, len(sources))
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, source in enumerate(sources):
+            queue.put_nowait((index, source))
+        for _ in range(worker_count):
+            queue.put_nowait(None)
+        
+        results: List[Optional[CrawlResult]] = [None] * len(sources)
+        pending: List[Tuple[str, bool]] = []
+        flush_lock = asyncio.Lock()
+        
+        async def flush():
+            # One save at a time, each taking every update recorded so far
+            async with flush_lock:
+                if pending:
+                    batch = pending[:]
+                    pending.clear()
+                    await self.source_manager.update_sources_last_crawl(batch)
         
-        async def crawl_with_semaphore(source):
-            async with semaphore:
-                return await self.crawl_source(source)
+        async def worker():
+            while (item := await queue.get()) is not None:
+                index, source = item
+                result = await self.crawl_source(source, update_last_crawl=False)
+                results[index] = result
+                pending.append((source.id, result.success))
+                if len(pending) >= LAST_CRAWL_BATCH_SIZE:
+                    await flush()
         
-        for source in sources:
-            tasks.append(crawl_with_semaphore(source))
+        # Run the workers until the queue is drained
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
         
-        # Run all tasks concurrently with limited concurrency
-        results = await asyncio.gather(*tasks)
+        # Record the crawls of the last partial batch
+        await flush()
         
-        # Calculate totals
-        total_tools = sum(result.tools_discovered for result in results if result.success)
-        total_new_tools = sum(result.new_tools for result in results if result.success)
-        total_updated_tools = sum(result.updated_tools for result in results if result.success)
-        success_count = sum(1 for result in results if result.success)
+        # Calculate totals in a single pass
+        success_count = total_tools = total_new_tools = total_updated_tools = 0
+        for result in results:
+            if result.success:
+                success_count += 1
+                total_tools += result.tools_discovered
+                total_new_tools += result.new_tools
+                total_updated_tools += result.updated_tools
         
-        logger.info(f"Completed crawling {len(sources)} sources:")
-        logger.info(f"- Success: {success_count}")
-        logger.info(f"- Failed: {len(sources) - success_count}")
-        logger.info(f"- Total tools discovered: {total_tools}")
-        logger.info(f"- New tools: {total_new_tools}")
-        logger.info(f"- Updated tools: {total_updated_tools}")
+        # One record, formatted only if INFO is enabled
+        logger.info(
+            "Completed crawling %d sources:\n- Success: %d\n- Failed: %d\n"
+            "- Total tools discovered: %d\n- New tools: %d\n- Updated tools: %d",
+            len(sources), success_count, len(sources) - success_count,
+            total_tools, total_new_tools, total_updated_tools,
+        )
         
         return results
@@ -2,20 +2,37 @@
 Source management service for MCP tool crawler.
 """
 
+import logging
 import time
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from ..models import Source, SourceType
 from ..utils.logging import get_logger
 from ..utils.config import get_config
-from ..utils.helpers import is_github_repo, extract_domain
+from ..utils.helpers import extract_domain, classify_source, select_new_sources
 from ..storage import get_source_storage
 
 logger = get_logger(__name__)
 config = get_config()
 
 
+@lru_cache(maxsize=8)
+def _crawl_threshold(hours: int, minute: int) -> str:
+    """
+    Get the ISO timestamp a number of hours before a minute bucket.
+    
+    Args:
+        hours: Number of hours to go back.
+        minute: Minutes since the epoch to go back from.
+        
+    Returns:
+        ISO format timestamp in UTC.
+    """
+    return (datetime.fromtimestamp(minute * 60, timezone.utc) - timedelta(hours=hours)).isoformat()
+
+
 class SourceManager:
     """
     Service for managing sources in the crawler.
@@ -27,83 +44,155 @@ class SourceManager:
         """
         # Initialize storage
         self.storage = get_source_storage()
+        # Sources by ID, loaded from storage on first use, and the version of
+        # the source list they came from
+        self._sources_by_id: Optional[Dict[str, Source]] = None
+        self._sources_version: Optional[Tuple[int, ...]] = None
+    
+    def _source_list_version(self) -> Optional[Tuple[int, ...]]:
+        """
+        Get the version of the storage's source list.
+        
+        Returns:
+            The version, or None if the storage doesn't track one.
+        """
+        version = getattr(self.storage, 'version', None)
+        return version() if version else None
     
-    async def initialize_sources(self) -> List[Source]:
+    async def _get_sources_index(self) -> Dict[str, Source]:
         """
-        Initialize sources from the configuration and local source list.
+        Get the in-memory index of sources by ID, reloading it when the source list changes.
+        
+        The index holds the stored sources; callers get copies of them.
+        
+        Returns:
+            Dictionary mapping source IDs to sources.
+        """
+        version = self._source_list_version()
+        if self._sources_by_id is None or version != self._sources_version:
+            sources = await self.storage.load_sources()
+            self._sources_by_id = {source.id: source for source in sources}
+            self._sources_version = version
+        
+        return self._sources_by_id
+    
+    async def _store_sources(self, sources: List[Source]) -> bool:
+        """
+        Add or replace sources and save the full source list once.
+        
+        The index only takes the sources once the save succeeds.
+        
+        Args:
+            sources: Sources to store.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        index = dict(await self._get_sources_index())
+        for source in sources:
+            index[source.id] = source
+        
+        if not await self.storage.save_sources(list(index.values())):
+            return False
+        
+        self._sources_by_id = index
+        self._sources_version = self._source_list_version()
+        return True
+    
+    async def initialize_sources(self, s3_bucket_name: Optional[str] = None,
+                                 s3_source_list_key: Optional[str] = None) -> List[Source]:
+        """
+        Initialize sources from the configuration and a source list.
         
         This loads sources from:
-        1. The local source list file if available
+        1. The S3 source list if a bucket and key are given, otherwise the local source list file
         2. Predefined sources from configuration (as fallback)
         
         Sources are added to storage for tracking.
         
+        Args:
+            s3_bucket_name: S3 bucket holding the source list.
+            s3_source_list_key: S3 key of the source list.
+        
         Returns:
             List of all sources (existing + newly added).
         """
         logger.info("Initializing sources")
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         # Get existing sources
         existing_sources = await self.get_all_sources()
         existing_urls = {source.url for source in existing_sources}
         
-        # Try to load sources from local storage first
+        if s3_bucket_name and s3_source_list_key:
+            # Imported here so boto3 is only loaded when S3 is used
+            from ..storage.s3_storage import S3SourceStorage
+            source_list = S3SourceStorage(s3_bucket_name, s3_source_list_key)
+            source_list_name = f"s3://{s3_bucket_name}/{s3_source_list_key}"
+        else:
+            source_list = self.storage
+            source_list_name = "local storage"
+        
+        # Try to load sources from the source list first
         try:
-            local_sources = await self.storage.load_sources()
+            local_sources = await source_list.load_sources()
             
             if local_sources:
-                logger.info(f"Loaded {len(local_sources)} sources from local storage")
+                logger.info(f"Loaded {len(local_sources)} sources from {source_list_name}")
+                
+                # Add sources from the source list that don't already exist, with a single save
+                new_sources = select_new_sources(local_sources, existing_urls)
+                if new_sources and not await self._store_sources(new_sources):
+                    logger.error(f"Failed to save {len(new_sources)} new sources from {source_list_name}")
+                    return existing_sources
+                existing_sources.extend(new_sources)
                 
-                # Add sources from local storage that don't already exist
-                for source in local_sources:
-                    if source.url not in existing_urls:
-                        await self.add_source(source)
-                        existing_sources.append(source)
-                        existing_urls.add(source.url)
-                        
-                        logger.info(f"Added new source from local storage: {source.name} ({source.url})")
+                if debug:
+                    for source in new_sources:
+                        logger.debug("Added new source from %s: %s (%s)", source_list_name, source.name, source.url)
+                logger.info("Added %d new sources from %s: %s",
+                            len(new_sources), source_list_name, [source.name for source in new_sources])
                 
                 return existing_sources
         except Exception as e:
-            logger.warning(f"Error loading sources from local storage, falling back to config: {str(e)}")
+            logger.warning(f"Error loading sources from {source_list_name}, falling back to config: {str(e)}")
         
         # If no sources from local storage or error occurred, fall back to config
         logger.info("Using predefined sources from configuration")
         
-        # Add awesome lists from config
-        for url in config['sources']['awesome_lists']:
-            if url not in existing_urls:
-                domain = extract_domain(url)
-                name = f"Awesome MCP Tools ({domain})"
-                
-                source = Source(
-                    url=url,
-                    name=name,
-                    type=SourceType.GITHUB_AWESOME_LIST,
-                    has_known_crawler=True,
-                )
-                
-                await self.add_source(source)
-                existing_sources.append(source)
-                existing_urls.add(url)
-                
-                logger.info(f"Added new source from config: {name} ({url})")
-        
-        # Add websites from config
-        for website in config['sources']['websites']:
-            if website['url'] not in existing_urls:
-                source = Source(
-                    url=website['url'],
-                    name=website['name'],
-                    type=SourceType.WEBSITE,
-                    has_known_crawler=False,
-                )
-                
-                await self.add_source(source)
-                existing_sources.append(source)
-                existing_urls.add(website['url'])
-                
-                logger.info(f"Added new source from config: {website['name']} ({website['url']})")
+        # Awesome lists from config
+        config_sources = [
+            Source(
+                url=url,
+                name=f"Awesome MCP Tools ({extract_domain(url)})",
+                type=SourceType.GITHUB_AWESOME_LIST,
+                has_known_crawler=True,
+            )
+            for url in config['sources']['awesome_lists']
+        ]
+        
+        # Websites from config
+        config_sources.extend(
+            Source(
+                url=website['url'],
+                name=website['name'],
+                type=SourceType.WEBSITE,
+                has_known_crawler=False,
+            )
+            for website in config['sources']['websites']
+        )
+        
+        new_sources = select_new_sources(config_sources, existing_urls)
+        if new_sources and not await self._store_sources(new_sources):
+            logger.error(f"Failed to save {len(new_sources)} new sources from config")
+            return existing_sources
+        existing_sources.extend(new_sources)
+        
+        if debug:
+            for source in new_sources:
+                logger.debug("Added new source from config: %s (%s)", source.name, source.url)
+        logger.info("Added %d new sources from config: %s",
+                    len(new_sources), [source.name for source in new_sources])
         
         return existing_sources
     
@@ -118,8 +207,8 @@ class SourceManager:
             The added source.
         """
         try:
-            # Save to storage
-            await self.storage.save_sources([source])
+            # Save to storage along with the existing sources
+            await self._store_sources([source])
             logger.info(f"Added source: {source.name} ({source.url})")
             return source
         except Exception as e:
@@ -139,29 +228,7 @@ class SourceManager:
         Returns:
             The added source.
         """
-        # Detect source type if not provided
-        if not source_type:
-            if is_github_repo(url):
-                # Check if it looks like an awesome list (has "awesome" in the URL)
-                if 'awesome' in url.lower():
-                    source_type = SourceType.GITHUB_AWESOME_LIST
-                else:
-                    source_type = SourceType.GITHUB_REPOSITORY
-            else:
-                source_type = SourceType.WEBSITE
-        
-        # Generate name if not provided
-        if not name:
-            domain = extract_domain(url)
-            name = f"MCP Tools ({domain})"
-        
-        # Create source
-        source = Source(
-            url=url,
-            name=name,
-            type=source_type,
-            has_known_crawler=source_type in [SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY],
-        )
+        source = classify_source(url, source_type, name)
         
         # Add to storage
         return await self.add_source(source)
@@ -174,13 +241,26 @@ class SourceManager:
             List of all sources.
         """
         try:
-            sources = await self.storage.load_sources()
-            logger.info(f"Retrieved {len(sources)} sources from storage")
+            sources = [source.model_copy() for source in (await self._get_sources_index()).values()]
+            logger.info(f"Retrieved {len(sources)} sources")
             return sources
         except Exception as e:
             logger.error(f"Error retrieving sources: {str(e)}")
             return []
     
+    async def get_source(self, source_id: str) -> Optional[Source]:
+        """
+        Get a source by ID.
+        
+        Args:
+            source_id: ID of the source to get.
+            
+        Returns:
+            Source if found, None otherwise.
+        """
+        source = (await self._get_sources_index()).get(source_id)
+        return source.model_copy() if source is not None else None
+    
     async def get_sources_to_crawl(self, time_threshold_hours: int = 24) -> List[Source]:
         """
         Get sources that need to be crawled.
@@ -196,9 +276,8 @@ class SourceManager:
             # Get all sources
             all_sources = await self.get_all_sources()
             
-            # Calculate threshold timestamp
-            threshold_time = (datetime.now(timezone.utc) - 
-                             timedelta(hours=time_threshold_hours)).isoformat()
+            # Calculate threshold timestamp, reused for the rest of the current minute
+            threshold_time = _crawl_threshold(time_threshold_hours, int(time.time() // 60))
             
             # Filter sources
             sources_to_crawl = []
@@ -225,26 +304,48 @@ class SourceManager:
         Returns:
             True if successful, False otherwise.
         """
+        if await self.update_sources_last_crawl([(source_id, success)]) == 0:
+            logger.warning(f"Source {source_id} not found for update")
+            return False
+        
+        return True
+    
+    async def update_sources_last_crawl(self, updates: List[Tuple[str, bool]]) -> int:
+        """
+        Update the last crawl information of multiple sources with a single save.
+        
+        Args:
+            updates: (source ID, whether the crawl was successful) pairs.
+            
+        Returns:
+            Number of sources updated, or 0 if they could not be saved.
+        """
+        if not updates:
+            return 0
+        
         try:
-            # Get all sources
-            sources = await self.get_all_sources()
+            index = await self._get_sources_index()
+            timestamp = datetime.now(timezone.utc).isoformat()
             
-            # Find the source to update
-            for source in sources:
-                if source.id == source_id:
-                    # Update source
-                    source.last_crawled = datetime.now(timezone.utc).isoformat()
-                    source.last_crawl_status = 'success' if success else 'failed'
-                    
-                    # Save updated sources
-                    await self.storage.save_sources(sources)
-                    
-                    logger.info(f"Updated last crawl for source {source_id}")
-                    return True
+            # Update copies, so the index keeps the stored sources if the save fails
+            updated_sources = {}
+            for source_id, success in updates:
+                source = index.get(source_id)
+                if source is not None:
+                    updated_sources[source_id] = source.model_copy(update={
+                        'last_crawled': timestamp,
+                        'last_crawl_status': 'success' if success else 'failed',
+                    })
             
-            logger.warning(f"Source {source_id} not found for update")
-            return False
+            # Save updated sources once for the whole batch
+            if updated_sources:
+                if not await self._store_sources(list(updated_sources.values())):
+                    logger.error(f"Failed to save last crawl for {len(updated_sources)} sources")
+                    return 0
+                logger.info(f"Updated last crawl for {len(updated_sources)} sources")
+            
+            return len(updated_sources)
         except Exception as e:
             logger.error(f"Error updating source last crawl: {str(e)}")
-            return False
+            return 0
 
@@ -2,18 +2,24 @@
 Source management service for MCP tool crawler using SQLite storage.
 """
 
-from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+import logging
+import os
+import time
+from typing import List, Dict, Optional, Tuple
 
 from ..models import Source, SourceType
 from ..utils.logging import get_logger
 from ..utils.config import get_config
-from ..utils.helpers import is_github_repo, extract_domain
-from ..storage.sqlite_storage import SQLiteStorage
+from ..utils.helpers import extract_domain, classify_source, select_new_sources
+from ..storage import get_sqlite_storage
+from ..storage.local_storage import LocalStorage
 
 logger = get_logger(__name__)
 config = get_config()
 
+# _meta key holding the mtime of the source list file when it was last ingested
+SOURCE_LIST_MTIME_KEY = 'sources_yaml_mtime_ns'
+
 
 class SQLiteSourceManager:
     """
@@ -27,8 +33,12 @@ class SQLiteSourceManager:
         Args:
             db_path: Optional path to the SQLite database file.
         """
-        # Initialize SQLite storage
-        self.storage = SQLiteStorage(db_path)
+        # Share the SQLite storage (and its connection) with other services using the database
+        self.storage = get_sqlite_storage(db_path)
+        
+        # Cached result of get_all_sources, reloaded when the storage's sources change
+        self._sources_cache: Optional[List[Source]] = None
+        self._sources_cache_version: Optional[Tuple[int, int]] = None
     
     async def initialize_sources(self) -> List[Source]:
         """
@@ -44,72 +54,81 @@ class SQLiteSourceManager:
             List of all sources (existing + newly added).
         """
         logger.info("Initializing sources")
+        debug = logger.isEnabledFor(logging.DEBUG)
         
-        # Get existing sources
-        existing_sources = await self.get_all_sources()
-        existing_urls = {source.url for source in existing_sources}
+        # Get the URLs of existing sources straight from the database
+        existing_urls = await self.storage.get_all_source_urls()
         
         # Try to load sources from local file first
         try:
-            from ..storage.local_storage import LocalStorage
-            local_source_storage = LocalStorage(config.get('source_list_path', None))
+            local_source_storage = LocalStorage(source_list_path=config.get('source_list_path', None))
+            
+            # Skip parsing the file if it hasn't changed since it was last ingested
+            try:
+                source_list_mtime = str(os.stat(local_source_storage.source_list_path).st_mtime_ns)
+            except FileNotFoundError:
+                source_list_mtime = None
+            
+            ingested_mtime = await self.storage.get_meta(SOURCE_LIST_MTIME_KEY)
+            if source_list_mtime is not None and source_list_mtime == ingested_mtime:
+                logger.info("Source list unchanged since last initialization")
+                return await self.get_all_sources()
+            
             local_sources = await local_source_storage.load_sources()
             
             if local_sources:
                 logger.info(f"Loaded {len(local_sources)} sources from local file")
                 
-                # Add sources from local file that don't already exist
-                for source in local_sources:
-                    if source.url not in existing_urls:
-                        await self.add_source(source)
-                        existing_sources.append(source)
-                        existing_urls.add(source.url)
-                        
-                        logger.info(f"Added new source from local file: {source.name} ({source.url})")
+                # Add sources from local file that don't already exist, in a single transaction
+                new_sources = select_new_sources(local_sources, existing_urls)
+                await self.add_sources(new_sources)
                 
-                return existing_sources
+                if debug:
+                    for source in new_sources:
+                        logger.debug("Added new source from local file: %s (%s)", source.name, source.url)
+                logger.info("Added %d new sources from local file: %s",
+                            len(new_sources), [source.name for source in new_sources])
+                
+                await self.storage.set_meta(SOURCE_LIST_MTIME_KEY, source_list_mtime)
+                return await self.get_all_sources()
         except Exception as e:
             logger.warning(f"Error loading sources from local file, falling back to config: {str(e)}")
         
         # If no sources from local file or error occurred, fall back to config
         logger.info("Using predefined sources from configuration")
         
-        # Add awesome lists from config
-        for url in config['sources']['awesome_lists']:
-            if url not in existing_urls:
-                domain = extract_domain(url)
-                name = f"Awesome MCP Tools ({domain})"
-                
-                source = Source(
-                    url=url,
-                    name=name,
-                    type=SourceType.GITHUB_AWESOME_LIST,
-                    has_known_crawler=True,
-                )
-                
-                await self.add_source(source)
-                existing_sources.append(source)
-                existing_urls.add(url)
-                
-                logger.info(f"Added new source from config: {name} ({url})")
-        
-        # Add websites from config
-        for website in config['sources']['websites']:
-            if website['url'] not in existing_urls:
-                source = Source(
-                    url=website['url'],
-                    name=website['name'],
-                    type=SourceType.WEBSITE,
-                    has_known_crawler=False,
-                )
-                
-                await self.add_source(source)
-                existing_sources.append(source)
-                existing_urls.add(website['url'])
-                
-                logger.info(f"Added new source from config: {website['name']} ({website['url']})")
+        # Awesome lists from config
+        config_sources = [
+            Source(
+                url=url,
+                name=f"Awesome MCP Tools ({extract_domain(url)})",
+                type=SourceType.GITHUB_AWESOME_LIST,
+                has_known_crawler=True,
+            )
+            for url in config['sources']['awesome_lists']
+        ]
+        
+        # Websites from config
+        config_sources.extend(
+            Source(
+                url=website['url'],
+                name=website['name'],
+                type=SourceType.WEBSITE,
+                has_known_crawler=False,
+            )
+            for website in config['sources']['websites']
+        )
+        
+        new_sources = select_new_sources(config_sources, existing_urls)
+        await self.add_sources(new_sources)
+        
+        if debug:
+            for source in new_sources:
+                logger.debug("Added new source from config: %s (%s)", source.name, source.url)
+        logger.info("Added %d new sources from config: %s",
+                    len(new_sources), [source.name for source in new_sources])
         
-        return existing_sources
+        return await self.get_all_sources()
     
     async def add_source(self, source: Source) -> Source:
         """
@@ -133,6 +152,31 @@ class SQLiteSourceManager:
             logger.error(f"Error adding source: {str(e)}")
             raise
     
+    async def add_sources(self, sources: List[Source]) -> List[Source]:
+        """
+        Add multiple sources to the crawler in a single transaction.
+        
+        Args:
+            sources: Sources to add.
+            
+        Returns:
+            The added sources.
+        """
+        if not sources:
+            return sources
+        
+        try:
+            # Save to SQLite
+            success = await self.storage.save_sources_bulk(sources)
+            if not success:
+                raise Exception("Failed to save sources to SQLite")
+            
+            logger.info(f"Added {len(sources)} sources")
+            return sources
+        except Exception as e:
+            logger.error(f"Error adding sources: {str(e)}")
+            raise
+    
     async def add_source_by_url(self, url: str, name: Optional[str] = None, 
                                source_type: Optional[SourceType] = None) -> Source:
         """
@@ -146,29 +190,7 @@ class SQLiteSourceManager:
         Returns:
             The added source.
         """
-        # Detect source type if not provided
-        if not source_type:
-            if is_github_repo(url):
-                # Check if it looks like an awesome list (has "awesome" in the URL)
-                if 'awesome' in url.lower():
-                    source_type = SourceType.GITHUB_AWESOME_LIST
-                else:
-                    source_type = SourceType.GITHUB_REPOSITORY
-            else:
-                source_type = SourceType.WEBSITE
-        
-        # Generate name if not provided
-        if not name:
-            domain = extract_domain(url)
-            name = f"MCP Tools ({domain})"
-        
-        # Create source
-        source = Source(
-            url=url,
-            name=name,
-            type=source_type,
-            has_known_crawler=source_type in [SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY],
-        )
+        source = classify_source(url, source_type, name)
         
         # Add to storage
         return await self.add_source(source)
@@ -180,7 +202,14 @@ class SQLiteSourceManager:
         Returns:
             List of all sources.
         """
-        return await self.storage.get_all_sources()
+        # Read the version first, so a write made during the load triggers another one
+        version = self.storage.sources_version()
+        if self._sources_cache is None or version != self._sources_cache_version:
+            self._sources_cache = await self.storage.get_all_sources()
+            self._sources_cache_version = version
+        
+        # Hand out copies so callers can't change the cached sources
+        return [source.model_copy() for source in self._sources_cache]
     
     async def get_sources_to_crawl(self, time_threshold_hours: int = 24) -> List[Source]:
         """
@@ -194,9 +223,8 @@ class SQLiteSourceManager:
             List of sources to crawl.
         """
         try:
-            # Calculate threshold timestamp
-            threshold_time = (datetime.now(timezone.utc) - 
-                             timedelta(hours=time_threshold_hours)).isoformat()
+            # Calculate threshold as Unix epoch seconds
+            threshold_time = int(time.time()) - time_threshold_hours * 3600
             
             # Get sources that need to be crawled
             return await self.storage.get_sources_to_crawl(threshold_time)
@@ -217,6 +245,18 @@ class SQLiteSourceManager:
         """
         return await self.storage.update_source_last_crawl(source_id, success)
     
+    async def update_sources_last_crawl(self, updates: List[Tuple[str, bool]]) -> int:
+        """
+        Update the last crawl information of multiple sources at once.
+        
+        Args:
+            updates: (source ID, whether the crawl was successful) pairs.
+            
+        Returns:
+            Number of sources updated.
+        """
+        return await self.storage.update_sources_last_crawl(updates)
+    
     async def get_source(self, source_id: str) -> Optional[Source]:
         """
         Get a source by ID.
@@ -3,35 +3,71 @@ Storage services for MCP tools.
 """
 
 import os
-from typing import List, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
-from .s3_storage import S3Storage
-from .sqlite_storage import SQLiteStorage
-from ..models import MCPTool, Source
+from .sqlite_storage import SQLiteStorage, DEFAULT_DB_PATH, get_shared_storage
 from .local_storage import LocalStorage, LocalSourceStorage
 
 
+def get_sqlite_storage(db_path: Optional[str] = None) -> SQLiteStorage:
+    """
+    Get the shared SQLite storage service for a database.
+    
+    Each SQLiteStorage holds a connection and sets up the schema when created,
+    so services in the same process share one instance per database.
+    
+    Args:
+        db_path: Path to the SQLite database file. If None, uses the default path.
+    
+    Returns:
+        The SQLite storage service for the database.
+    """
+    # Resolve the path first, so the default and every spelling of a path share one instance
+    return get_shared_storage(Path(db_path or DEFAULT_DB_PATH).resolve())
+
+
 def get_storage():
     """
     Get the appropriate storage service based on the environment.
     
-    In production, uses S3Storage, in development, uses SQLiteStorage.
-    Now that S3Storage is being replaced, this always returns LocalStorage.
+    In production with STORAGE_TYPE=s3, uses S3Storage. Otherwise uses
+    LocalStorage if STORAGE_TYPE=local, and the shared SQLiteStorage by default.
     
     Returns:
         A storage service instance.
     """
     env = os.environ.get('ENVIRONMENT', 'development')
     storage_type = os.environ.get('STORAGE_TYPE', 'sqlite')
+    if (env == 'production' and storage_type == 's3') or storage_type == 'local':
+        return _get_storage(env, storage_type)
+    # Looked up on every call, since closing the shared storage replaces it
+    return get_sqlite_storage()
+
+
+@lru_cache(maxsize=None)
+def _get_storage(env: str, storage_type: str):
+    """
+    Get the shared S3 or local storage service for an environment and storage type.
+    
+    Services are shared so the S3 client and the parsed local catalog are
+    reused across callers.
+    
+    Args:
+        env: Deployment environment.
+        storage_type: Requested storage type, 's3' or 'local'.
     
+    Returns:
+        A storage service instance.
+    """
     if env == 'production' and storage_type == 's3':
+        # Imported here so boto3 is only loaded when S3 is used
+        from .s3_storage import S3Storage
         return S3Storage()
-    elif storage_type == 'local':
-        return LocalStorage()
-    else:
-        return SQLiteStorage()
     return LocalStorage()
 
+
 def get_source_storage():
     """
     Get the appropriate source storage service.
@@ -2,25 +2,211 @@
 Local file storage service for MCP tools and sources.
 """
 
+import asyncio
+import hashlib
 import json
+import mmap
 import os
 import yaml
 
 import shutil
+import threading
 import time
-import fcntl
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import BinaryIO, Iterator, List, Dict, Any, Optional, Tuple, Union
 
-from ..models import MCPTool, Source, SourceType
+from ..models import MCPTool, Source
 from ..utils.logging import get_logger
 
 from ..utils.config import get_config
-from ..utils.helpers import is_github_repo, extract_domain
+from ..utils.helpers import dump_json, ensure_directory, load_json, parse_source_list
+
+# Prefer libyaml's C loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 logger = get_logger(__name__)
 config = get_config()
 
+# Files used when LocalStorage isn't given paths
+DEFAULT_DATA_DIR = Path(__file__).parents[3] / 'data'
+DEFAULT_TOOLS_PATH = DEFAULT_DATA_DIR / 'tools.json'
+DEFAULT_SOURCE_LIST_PATH = DEFAULT_DATA_DIR / 'sources.yaml'
+
+
+def _temp_path(path: Path) -> Path:
+    """
+    Name the temporary file a new version of a file is written to before it
+    replaces the file.
+    
+    The name is unique to the calling process and thread, so concurrent saves
+    never write to the same temporary file and the last one to replace the
+    file wins, without any locking.
+    
+    Args:
+        path: File to be replaced.
+        
+    Returns:
+        Path of the temporary file, next to the file.
+    """
+    return path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """
+    Write a file in one go and sync it to disk.
+    
+    Args:
+        path: File to write, replacing any existing contents.
+        payload: Contents of the file.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)  # Ensure data is written to disk
+    finally:
+        os.close(fd)
+
+
+def _file_version(stat: os.stat_result) -> Tuple[int, int, int]:
+    """
+    Identify a version of a file.
+    
+    Saves replace the file with a new inode, so the inode, modification time
+    and size change whenever the contents do.
+    
+    Args:
+        stat: Status of the file.
+        
+    Returns:
+        Tuple of the file's inode, modification time in nanoseconds and size.
+    """
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def _map_file(f: BinaryIO) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map an open file into memory read-only, so it can be parsed without
+    first copying its contents into a bytes object.
+    
+    Saves replace files rather than writing to them, so the mapping can't
+    change while it's parsed and no lock is needed.
+    
+    Args:
+        f: File opened for reading in binary mode.
+        
+    Yields:
+        The mapped file, or empty bytes for an empty file, which can't be mapped.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b''
+        return
+    
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+def _load_source_list(path: Path) -> Tuple[List[Source], Tuple[int, int, int]]:
+    """
+    Load the sources of a source list file, caching them as JSON next to it.
+    
+    The cache holds the sources built by parse_source_list, keyed by the file's
+    version, so loads of the same version, including by later processes, skip
+    both the YAML parse and URL classification.
+    
+    Args:
+        path: Source list file.
+        
+    Returns:
+        Tuple of the sources and the version of the file they came from.
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        yaml.YAMLError: If the file isn't valid YAML.
+    """
+    cache_path = path.with_name(f"{path.name}.cache.json")
+    
+    with open(path, 'rb') as f:
+        version = _file_version(os.fstat(f.fileno()))
+        try:
+            cached = load_json(cache_path.read_bytes())
+            if tuple(cached['version']) == version:
+                return [Source(**item) for item in cached['sources']], version
+        except Exception:
+            # Missing, unreadable or stale cache; parse the file instead
+            pass
+        
+        # Parse the YAML straight from the mapped file
+        with _map_file(f) as mapped:
+            data = yaml.load(mapped, Loader=YamlLoader)
+    
+    sources = parse_source_list(data.get('sources', []))
+    
+    # The cache only saves work, so failing to write it isn't an error
+    try:
+        temp_file = _temp_path(cache_path)
+        temp_file.write_bytes(dump_json({
+            'version': version,
+            'sources': [source.model_dump(mode='json') for source in sources],
+        }))
+        os.replace(temp_file, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache source list {path}: {str(e)}")
+    
+    return sources, version
+
+
+def _backup_timestamp(backup_path: Path) -> int:
+    """
+    Get the time a backup was created from its file name.
+    
+    Args:
+        backup_path: Backup file, named <prefix>_<unix timestamp><suffix>.
+        
+    Returns:
+        The backup's timestamp, or -1 if the name doesn't hold one.
+    """
+    try:
+        return int(backup_path.stem.rsplit('_', 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _create_backup(file_path: Path, backup_dir: Path, prefix: str, suffix: str) -> None:
+    """
+    Keep the current version of a file as a timestamped backup and prune old backups.
+    
+    Args:
+        file_path: File about to be replaced.
+        backup_dir: Directory holding the file's backups.
+        prefix: Backup file name prefix.
+        suffix: Backup file name suffix.
+    """
+    if not file_path.exists():
+        return
+    
+    backup_path = backup_dir / f"{prefix}_{int(time.time())}{suffix}"
+    try:
+        # The file is replaced rather than modified in place, so a hard link
+        # keeps its current contents without copying them
+        os.link(file_path, backup_path)
+    except OSError:
+        # Backup directory on another filesystem, or a backup from the same second
+        shutil.copy2(file_path, backup_path)
+    logger.debug(f"Created backup at {backup_path}")
+    
+    backup_count = config['storage']['local']['backup_count']
+    if backup_count > 0:
+        backups = sorted(backup_dir.glob(f"{prefix}_*{suffix}"), key=_backup_timestamp, reverse=True)
+        for old_backup in backups[backup_count:]:
+            old_backup.unlink(missing_ok=True)
+
 
 class LocalStorage:
     """
@@ -36,28 +222,43 @@ class LocalStorage:
             file_path: Path to the file to store tools in. If None, uses the default path.
             source_list_path: Path to the file to store sources in. If None, uses the default path.
         """
-        if file_path:
-            self.file_path = Path(file_path)
-        else:
-            self.file_path = Path(__file__).parents[3] / 'data' / 'tools.json'
-        
-        if source_list_path:
-            self.source_list_path = Path(source_list_path)
-        else:
-            self.source_list_path = Path(__file__).parents[3] / 'data' / 'sources.yaml'
+        self.file_path = Path(file_path) if file_path else DEFAULT_TOOLS_PATH
+        self.source_list_path = Path(source_list_path) if source_list_path else DEFAULT_SOURCE_LIST_PATH
         
         # Ensure data directory exists
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(str(self.file_path.parent))
         
         # Directory for versioned backups
         self.backup_dir = self.file_path.parent / 'backups' / 'tools'
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(str(self.backup_dir))
+        
+        # Tools parsed from the file, and the version of the file they came from
+        self._tools: List[MCPTool] = []
+        self._tools_version: Optional[Tuple[int, int, int]] = None
+        
+        # Digest of the last catalog written, and the version of the file it went to
+        self._saved_digest: Optional[bytes] = None
+        self._saved_version: Optional[Tuple[int, int, int]] = None
     
     async def save_tools(self, tools: List[MCPTool]) -> bool:
         """
-        Save tools to a local file with file locking for concurrent access.
+        Save tools to a local file, atomically replacing the previous version.
         Also creates a versioned backup.
         
+        Args:
+            tools: List of tools to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        # File I/O and (de)serialization block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_tools, tools)
+    
+    def _save_tools(self, tools: List[MCPTool]) -> bool:
+        """
+        Blocking implementation of save_tools.
+        
         Args:
             tools: List of tools to save.
             
@@ -65,33 +266,31 @@ class LocalStorage:
             True if successful, False otherwise.
         """
         try:
-            # Convert tools to JSON
-            tools_json = [tool.dict() for tool in tools]
+            # Serialize the tools one at a time, so only the encoded catalog is held
+            # rather than a dict per tool as well. The catalog is machine-read,
+            # so skip pretty-printing.
+            payload = b'[' + b','.join(dump_json(tool.to_dict()) for tool in tools) + b']'
+            
+            # Skip the write, sync and backup if the file still holds this catalog
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._saved_digest and self._current_version() == self._saved_version:
+                logger.info(f"Tools unchanged, skipping save to {self.file_path}")
+                return True
             
             # Create a temporary file
-            temp_file = self.file_path.with_suffix('.tmp')
+            temp_file = _temp_path(self.file_path)
             
-            # Write to temporary file
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                # Acquire an exclusive lock
-                fcntl.flock(f, fcntl.LOCK_EX)
-                try:
-                    json.dump(tools_json, f, indent=2)
-                    f.flush()
-                    os.fsync(f.fileno())  # Ensure data is written to disk
-                finally:
-                    # Release the lock
-                    fcntl.flock(f, fcntl.LOCK_UN)
+            # Write to the temporary file. Nothing else opens it, and readers
+            # only ever see it once it atomically replaces the original file.
+            _write_file(temp_file, payload)
             
             # Create a backup before replacing the file
-            if self.file_path.exists():
-                timestamp = int(time.time())
-                backup_path = self.backup_dir / f"tools_{timestamp}.json"
-                shutil.copy2(self.file_path, backup_path)
-                logger.debug(f"Created backup at {backup_path}")
+            _create_backup(self.file_path, self.backup_dir, 'tools', '.json')
             
             # Atomically replace the original file
             os.replace(temp_file, self.file_path)
+            self._saved_digest = digest
+            self._saved_version = self._current_version()
             
             logger.info(f"Saved {len(tools)} tools to {self.file_path}")
             return True
@@ -102,38 +301,64 @@ class LocalStorage:
                 temp_file.unlink()
             return False
     
+    def _current_version(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the version of the tools file.
+        
+        Returns:
+            The file's version, or None if it doesn't exist.
+        """
+        try:
+            return _file_version(self.file_path.stat())
+        except FileNotFoundError:
+            return None
+    
     async def load_tools(self) -> List[MCPTool]:
         """
-        Load tools from a local file with file locking for concurrent access.
+        Load tools from a local file.
+        
+        The parsed tools are kept until the file changes, and callers get
+        their own copies of them.
+        
+        Returns:
+            List of tools loaded from the file.
+        """
+        # File I/O and (de)serialization block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_tools)
+    
+    def _load_tools(self) -> List[MCPTool]:
+        """
+        Blocking implementation of load_tools.
         
         Returns:
             List of tools loaded from the file.
         """
         try:
             # Check if file exists
-            if not self.file_path.exists():
+            try:
+                version = _file_version(self.file_path.stat())
+            except FileNotFoundError:
                 logger.warning(f"No tool catalog found at {self.file_path}")
                 return []
             
-            # Read file with shared lock
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                # Acquire a shared lock
-                fcntl.flock(f, fcntl.LOCK_SH)
-                try:
-                    data = json.load(f)
-                finally:
-                    # Release the lock
-                    fcntl.flock(f, fcntl.LOCK_UN)
-            
-            # Convert to MCPTool objects
-            tools = [MCPTool(**item) for item in data]
+            if version != self._tools_version:
+                # Parse the JSON straight from the mapped file
+                with open(self.file_path, 'rb') as f:
+                    version = _file_version(os.fstat(f.fileno()))
+                    with _map_file(f) as mapped, memoryview(mapped) as view:
+                        data = load_json(view)
+                
+                # The catalog is written from validated tools, so skip re-validation
+                self._tools = [MCPTool.model_construct(**item) for item in data]
+                self._tools_version = version
+                logger.info(f"Loaded {len(self._tools)} tools from {self.file_path}")
             
-            logger.info(f"Loaded {len(tools)} tools from {self.file_path}")
-            return tools
+            return [tool.model_copy() for tool in self._tools]
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error loading tools from {self.file_path}: {str(e)}")
             # Try to recover from backup
-            return await self._recover_from_backup()
+            return self._recover_from_backup()
         except Exception as e:
             logger.error(f"Error loading tools from local file: {str(e)}")
             return []
@@ -141,7 +366,36 @@ class LocalStorage:
     async def load_sources(self) -> List[Source]:
         """
         Load sources from a local YAML file.
-    async def _recover_from_backup(self) -> List[MCPTool]:
+        
+        Returns:
+            List of Source objects loaded from the file.
+        """
+        # File I/O and (de)serialization block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_sources)
+    
+    def _load_sources(self) -> List[Source]:
+        """
+        Blocking implementation of load_sources.
+        
+        Returns:
+            List of Source objects loaded from the file.
+        """
+        try:
+            # Read file, treating a missing one as an empty source list
+            try:
+                sources, _ = _load_source_list(self.source_list_path)
+            except FileNotFoundError:
+                logger.warning(f"No source list found at {self.source_list_path}")
+                return []
+            
+            logger.info(f"Loaded {len(sources)} sources from {self.source_list_path}")
+            return sources
+        except Exception as e:
+            logger.error(f"Error loading sources from local file: {str(e)}")
+            return []
+    
+    def _recover_from_backup(self) -> List[MCPTool]:
         """
         Attempt to recover tools from the most recent backup.
         
@@ -149,24 +403,20 @@ class LocalStorage:
             List of tools loaded from the backup, or empty list if recovery failed.
         """
         try:
-            # Find the most recent backup
-            backup_files = list(self.backup_dir.glob("tools_*.json"))
-            if not backup_files:
+            # Find the most recent backup by the timestamp in its name
+            latest_backup = max(self.backup_dir.glob("tools_*.json"), key=_backup_timestamp, default=None)
+            if latest_backup is None:
                 logger.warning("No backup files found for recovery")
                 return []
             
-            # Sort by modification time (most recent first)
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            latest_backup = backup_files[0]
-            
             logger.info(f"Attempting recovery from backup: {latest_backup}")
             
             # Read the backup file
-            with open(latest_backup, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_backup, 'rb') as f:
+                data = load_json(f.read())
             
-            # Convert to MCPTool objects
-            tools = [MCPTool(**item) for item in data]
+            # The catalog is written from validated tools, so skip re-validation
+            tools = [MCPTool.model_construct(**item) for item in data]
             
             # Restore the backup to the main file
             shutil.copy2(latest_backup, self.file_path)
@@ -194,113 +444,93 @@ class LocalSourceStorage:
         if file_path:
             self.file_path = Path(file_path)
         else:
-            sources_key = config['aws']['s3']['source_list_key']
-            self.file_path = Path(__file__).parents[3] / 'data' / sources_key
+            self.file_path = Path(config['storage']['local']['sources_file_path'])
         
         # Ensure data directory exists
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(str(self.file_path.parent))
         
         # Directory for versioned backups
         self.backup_dir = self.file_path.parent / 'backups' / 'sources'
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(str(self.backup_dir))
+        
+        # Sources parsed from the file, and the version of the file they came from
+        self._sources: List[Source] = []
+        self._sources_version: Optional[Tuple[int, int, int]] = None
+    
+    def version(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the version of the source list file.
+        
+        Returns:
+            The file's version, or None if it doesn't exist.
+        """
+        try:
+            return _file_version(self.file_path.stat())
+        except FileNotFoundError:
+            return None
     
     async def load_sources(self) -> List[Source]:
         """
         Load sources from local YAML file.
         
+        Returns:
+            List of Source objects loaded from the file.
+        """
+        # File I/O and (de)serialization block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_sources)
+    
+    def _load_sources(self) -> List[Source]:
+        """
+        Blocking implementation of load_sources.
+        
         Returns:
             List of Source objects loaded from the file.
         """
         try:
-            # Check if file exists
-            if not self.source_list_path.exists():
-                logger.warning(f"No source list found at {self.source_list_path}")
-                return []
-            
-            # Read file
-            with open(self.source_list_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            if not self.file_path.exists():
+            # Read file, treating a missing one as an empty source list
+            try:
+                if _file_version(self.file_path.stat()) == self._sources_version:
+                    return [source.model_copy() for source in self._sources]
+                
+                sources, version = _load_source_list(self.file_path)
+            except FileNotFoundError:
                 logger.warning(f"No source list found at {self.file_path}")
                 return []
             
-            # Read file with shared lock
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                # Acquire a shared lock
-                fcntl.flock(f, fcntl.LOCK_SH)
-                try:
-                    content = f.read()
-                finally:
-                    # Release the lock
-                    fcntl.flock(f, fcntl.LOCK_UN)
-            
-            # Parse YAML
-            data = yaml.safe_load(content)
-            sources_data = data.get('sources', [])
-            
-            sources = []
-            for item in sources_data:
-                url = item.get('url', '').strip()
-                if not url:
-                    continue
-                
-                name = item.get('name', '').strip()
-                source_type_str = item.get('type', '').strip().lower()
-                
-                # Determine source type
-                if source_type_str:
-                    try:
-                        source_type = SourceType(source_type_str)
-                    except ValueError:
-                        # Default to GITHUB_AWESOME_LIST if we can't parse the type
-                        source_type = SourceType.GITHUB_AWESOME_LIST if is_github_repo(url) else SourceType.WEBSITE
-                else:
-                    # Auto-detect source type
-                    if is_github_repo(url):
-                        # Check if it looks like an awesome list (has "awesome" in the URL)
-                        if 'awesome' in url.lower():
-                            source_type = SourceType.GITHUB_AWESOME_LIST
-                        else:
-                            source_type = SourceType.GITHUB_REPOSITORY
-                    else:
-                        source_type = SourceType.WEBSITE
-                
-                # Generate name if not provided
-                if not name:
-                    domain = extract_domain(url)
-                    name = f"MCP Tools ({domain})"
-                
-                # Create source
-                source = Source(
-                    url=url,
-                    name=name,
-                    type=source_type,
-                    has_known_crawler=source_type in [SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY],
-                )
-                
-                sources.append(source)
+            # Keep the parsed sources until the file changes
+            self._sources = sources
+            self._sources_version = version
             
-            logger.info(f"Loaded {len(sources)} sources from {self.source_list_path}")
-            return sources
-        except Exception as e:
-            logger.error(f"Error loading sources from local file: {str(e)}")
-            return []
             logger.info(f"Loaded {len(sources)} sources from {self.file_path}")
-            return sources
+            return [source.model_copy() for source in sources]
         except yaml.YAMLError as e:
             logger.error(f"YAML parse error loading sources from {self.file_path}: {str(e)}")
             # Try to recover from backup
-            return await self._recover_from_backup()
+            return self._recover_from_backup()
         except Exception as e:
             logger.error(f"Error loading sources from local file: {str(e)}")
             return []
     
     async def save_sources(self, sources: List[Source]) -> bool:
         """
-        Save sources to a local YAML file with file locking for concurrent access.
+        Save sources to a local YAML file, atomically replacing the previous version.
         Also creates a versioned backup.
         
+        Args:
+            sources: List of sources to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        # File I/O and (de)serialization block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_sources, sources)
+    
+    def _save_sources(self, sources: List[Source]) -> bool:
+        """
+        Blocking implementation of save_sources.
+        
         Args:
             sources: List of sources to save.
             
@@ -308,31 +538,23 @@ class LocalSourceStorage:
             True if successful, False otherwise.
         """
         try:
-            # Convert sources to dict for YAML
-            sources_data = [source.dict() for source in sources]
+            # Convert sources to plain dicts for YAML; JSON mode turns the
+            # SourceType enum into its value so the safe loader can read it back
+            sources_data = [source.model_dump(mode='json') for source in sources]
             yaml_data = {'sources': sources_data}
             
             # Create a temporary file
-            temp_file = self.file_path.with_suffix('.tmp')
+            temp_file = _temp_path(self.file_path)
             
-            # Write to temporary file
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                # Acquire an exclusive lock
-                fcntl.flock(f, fcntl.LOCK_EX)
-                try:
-                    yaml.dump(yaml_data, f, default_flow_style=False)
-                    f.flush()
-                    os.fsync(f.fileno())  # Ensure data is written to disk
-                finally:
-                    # Release the lock
-                    fcntl.flock(f, fcntl.LOCK_UN)
+            # Write to the temporary file, which only becomes visible to
+            # readers when it atomically replaces the original file
+            _write_file(
+                temp_file,
+                yaml.dump(yaml_data, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+            )
             
             # Create a backup before replacing the file
-            if self.file_path.exists():
-                timestamp = int(time.time())
-                backup_path = self.backup_dir / f"sources_{timestamp}.yaml"
-                shutil.copy2(self.file_path, backup_path)
-                logger.debug(f"Created backup at {backup_path}")
+            _create_backup(self.file_path, self.backup_dir, 'sources', '.yaml')
             
             # Atomically replace the original file
             os.replace(temp_file, self.file_path)
@@ -346,7 +568,7 @@ class LocalSourceStorage:
                 temp_file.unlink()
             return False
     
-    async def _recover_from_backup(self) -> List[Source]:
+    def _recover_from_backup(self) -> List[Source]:
         """
         Attempt to recover sources from the most recent backup.
         
@@ -354,21 +576,17 @@ class LocalSourceStorage:
             List of sources loaded from the backup, or empty list if recovery failed.
         """
         try:
-            # Find the most recent backup
-            backup_files = list(self.backup_dir.glob("sources_*.yaml"))
-            if not backup_files:
+            # Find the most recent backup by the timestamp in its name
+            latest_backup = max(self.backup_dir.glob("sources_*.yaml"), key=_backup_timestamp, default=None)
+            if latest_backup is None:
                 logger.warning("No backup files found for recovery")
                 return []
             
-            # Sort by modification time (most recent first)
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            latest_backup = backup_files[0]
-            
             logger.info(f"Attempting recovery from backup: {latest_backup}")
             
             # Read the backup file
-            with open(latest_backup, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            with open(latest_backup, 'rb') as f:
+                data = yaml.load(f, Loader=YamlLoader)
             
             sources_data = data.get('sources', [])
             sources = [Source(**item) for item in sources_data]
@@ -2,16 +2,22 @@
 S3 storage services for MCP tools and sources.
 """
 
-import json
+import asyncio
 import yaml
 import boto3
 import io
 from typing import List, Dict, Any, Optional, Union
 
-from ..models import MCPTool, Source, SourceType
+from ..models import MCPTool, Source
 from ..utils.logging import get_logger
 from ..utils.config import get_config
-from ..utils.helpers import is_github_repo, extract_domain
+from ..utils.helpers import dump_json, load_json, parse_source_list
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 logger = get_logger(__name__)
 config = get_config()
@@ -38,6 +44,20 @@ class S3Storage:
         """
         Save tools to S3.
         
+        Args:
+            tools: List of tools to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        # boto3 calls block on the network, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_tools, tools)
+    
+    def _save_tools(self, tools: List[MCPTool]) -> bool:
+        """
+        Blocking implementation of save_tools.
+        
         Args:
             tools: List of tools to save.
             
@@ -45,14 +65,14 @@ class S3Storage:
             True if successful, False otherwise.
         """
         try:
-            # Convert tools to JSON
-            tools_json = [tool.dict() for tool in tools]
+            # Convert tools to plain dicts; their fields are already JSON types
+            tools_json = [tool.to_dict() for tool in tools]
             
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=self.key,
-                Body=json.dumps(tools_json, indent=2),
+                Body=dump_json(tools_json),
                 ContentType='application/json'
             )
             
@@ -66,6 +86,17 @@ class S3Storage:
         """
         Load tools from S3.
         
+        Returns:
+            List of tools loaded from S3.
+        """
+        # boto3 calls block on the network, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_tools)
+    
+    def _load_tools(self) -> List[MCPTool]:
+        """
+        Blocking implementation of load_tools.
+        
         Returns:
             List of tools loaded from S3.
         """
@@ -87,9 +118,9 @@ class S3Storage:
             )
             
             # Parse JSON
-            data = json.loads(response['Body'].read().decode('utf-8'))
+            data = load_json(response['Body'].read())
             
-            # Convert to MCPTool objects
+            # Validate each item: the bucket may be written by other processes
             tools = [MCPTool(**item) for item in data]
             
             logger.info(f"Loaded {len(tools)} tools from S3 bucket: {self.bucket_name}/{self.key}")
@@ -120,6 +151,17 @@ class S3SourceStorage:
         """
         Load sources from S3 YAML file.
         
+        Returns:
+            List of Source objects loaded from S3.
+        """
+        # boto3 calls block on the network, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_sources)
+    
+    def _load_sources(self) -> List[Source]:
+        """
+        Blocking implementation of load_sources.
+        
         Returns:
             List of Source objects loaded from S3.
         """
@@ -141,51 +183,9 @@ class S3SourceStorage:
             )
             
             # Parse YAML
-            content = response['Body'].read().decode('utf-8')
-            data = yaml.safe_load(content)
-            sources_data = data.get('sources', [])
-            
-            sources = []
-            for item in sources_data:
-                url = item.get('url', '').strip()
-                if not url:
-                    continue
-                
-                name = item.get('name', '').strip()
-                source_type_str = item.get('type', '').strip().lower()
-                
-                # Determine source type
-                if source_type_str:
-                    try:
-                        source_type = SourceType(source_type_str)
-                    except ValueError:
-                        # Default to GITHUB_AWESOME_LIST if we can't parse the type
-                        source_type = SourceType.GITHUB_AWESOME_LIST if is_github_repo(url) else SourceType.WEBSITE
-                else:
-                    # Auto-detect source type
-                    if is_github_repo(url):
-                        # Check if it looks like an awesome list (has "awesome" in the URL)
-                        if 'awesome' in url.lower():
-                            source_type = SourceType.GITHUB_AWESOME_LIST
-                        else:
-                            source_type = SourceType.GITHUB_REPOSITORY
-                    else:
-                        source_type = SourceType.WEBSITE
-                
-                # Generate name if not provided
-                if not name:
-                    domain = extract_domain(url)
-                    name = f"MCP Tools ({domain})"
-                
-                # Create source
-                source = Source(
-                    url=url,
-                    name=name,
-                    type=source_type,
-                    has_known_crawler=source_type in [SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY],
-                )
-                
-                sources.append(source)
+            content = response['Body'].read()
+            data = yaml.load(content, Loader=YamlLoader)
+            sources = parse_source_list(data.get('sources', []))
             
             logger.info(f"Loaded {len(sources)} sources from S3 bucket: {self.bucket_name}/{self.key}")
             return sources
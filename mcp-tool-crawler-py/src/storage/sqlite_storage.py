@@ -2,44 +2,197 @@
 SQLite storage service for MCP tools and sources.
 """
 
-import json
+import asyncio
 import os
 import sqlite3
 import threading
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Set, Union, Tuple
 
-from ..models import MCPTool, Source, SourceType, CrawlerStrategy, CrawlResult
-from ..utils.logging import get_logger
-from ..utils.config import get_config
 import yaml
-import sqlite3
-import os
-from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
 
-from ..models import MCPTool, Source, SourceType
+from ..models import (
+    MCPTool, Source, CrawlerStrategy, CrawlResult,
+    SOURCE_ROW_COLUMNS, TOOL_ROW_COLUMNS,
+    CRAWLER_STRATEGY_ROW_COLUMNS, CRAWL_RESULT_ROW_COLUMNS,
+)
 from ..utils.logging import get_logger
 from ..utils.config import get_config
-from ..utils.helpers import is_github_repo, extract_domain
+from ..utils.helpers import dump_json, ensure_directory, parse_source_list
+
+# Prefer libyaml's C loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 logger = get_logger(__name__)
 config = get_config()
 
-# Thread-local storage for SQLite connections
-local = threading.local()
+
+def _dumps_json(value: Any) -> str:
+    """
+    Serialize a value for a JSON column.
+    
+    Args:
+        value: Value to serialize.
+        
+    Returns:
+        The value as a compact JSON string.
+    """
+    return dump_json(value).decode()
 
 
-class SQLiteStorage:
+# Selects sources in the column order Source.from_row expects
+SELECT_SOURCES = f"SELECT {', '.join(SOURCE_ROW_COLUMNS)} FROM sources"
+
+# Selects a source by ID or URL
+SELECT_SOURCE_BY_ID = f"{SELECT_SOURCES} WHERE id = ?"
+SELECT_SOURCE_BY_URL = f"{SELECT_SOURCES} WHERE url = ?"
+
+# Selects sources that have never been crawled or were crawled before a threshold
+SELECT_SOURCES_TO_CRAWL = f"{SELECT_SOURCES} WHERE last_crawled_ts IS NULL OR last_crawled_ts < ?"
+
+# Records the outcome of a source's latest crawl
+UPDATE_SOURCE_LAST_CRAWL = '''
+UPDATE sources
+SET last_crawled = ?, last_crawled_ts = ?, last_crawl_status = ?
+WHERE id = ?
+'''
+
+# Inserts a source or updates it in place. INSERT OR REPLACE would delete the
+# existing row first, cascading to the source's crawler strategies and crawl results.
+UPSERT_SOURCE = '''
+INSERT INTO sources (id, url, name, type, has_known_crawler, crawler_id, last_crawled, last_crawled_ts, last_crawl_status, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    url = excluded.url, name = excluded.name, type = excluded.type,
+    has_known_crawler = excluded.has_known_crawler, crawler_id = excluded.crawler_id,
+    last_crawled = excluded.last_crawled, last_crawled_ts = excluded.last_crawled_ts,
+    last_crawl_status = excluded.last_crawl_status, metadata = excluded.metadata
+'''
+
+# Inserts a crawler strategy or updates it in place
+UPSERT_CRAWLER_STRATEGY = '''
+INSERT INTO crawler_strategies (id, source_id, source_type, implementation, description, created, last_modified)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    source_id = excluded.source_id, source_type = excluded.source_type,
+    implementation = excluded.implementation, description = excluded.description,
+    created = excluded.created, last_modified = excluded.last_modified
+'''
+
+# Selects crawler strategies in the column order CrawlerStrategy.from_row expects
+SELECT_CRAWLER_STRATEGIES = f"SELECT {', '.join(CRAWLER_STRATEGY_ROW_COLUMNS)} FROM crawler_strategies"
+SELECT_CRAWLER_STRATEGY_BY_ID = f"{SELECT_CRAWLER_STRATEGIES} WHERE id = ?"
+SELECT_CRAWLER_STRATEGY_BY_SOURCE = f"{SELECT_CRAWLER_STRATEGIES} WHERE source_id = ?"
+
+# Database used when SQLiteStorage isn't given a path
+DEFAULT_DB_PATH = Path(__file__).parents[3] / 'data' / 'mcp_crawler.db'
+
+# Selects crawl results, without the auto-generated row ID, in the column
+# order CrawlResult.from_row expects
+SELECT_CRAWL_RESULTS = f"SELECT {', '.join(CRAWL_RESULT_ROW_COLUMNS)} FROM crawl_results"
+
+# Selects a source's crawl results, newest first, optionally before a timestamp
+SELECT_CRAWL_RESULTS_BY_SOURCE = f"{SELECT_CRAWL_RESULTS} WHERE source_id = ? ORDER BY timestamp DESC LIMIT ?"
+SELECT_CRAWL_RESULTS_BY_SOURCE_BEFORE = (
+    f"{SELECT_CRAWL_RESULTS} WHERE source_id = ? AND timestamp < ? ORDER BY timestamp DESC LIMIT ?"
+)
+
+# Records the outcome of a crawl
+INSERT_CRAWL_RESULT = '''
+INSERT INTO crawl_results (source_id, timestamp, success, tools_discovered, new_tools, updated_tools, duration, error)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Selects tools in the column order MCPTool.from_row expects
+SELECT_TOOLS = f"SELECT {', '.join(TOOL_ROW_COLUMNS)} FROM tools"
+SELECT_TOOL_BY_ID = f"{SELECT_TOOLS} WHERE id = ?"
+SELECT_TOOL_BY_URL = f"{SELECT_TOOLS} WHERE url = ?"
+SELECT_TOOLS_BY_SOURCE_URL = f"{SELECT_TOOLS} WHERE source_url = ?"
+
+# Inserts a tool or updates it in place
+UPSERT_TOOL = '''
+INSERT INTO tools (id, name, description, url, source_url, first_discovered, last_updated, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name, description = excluded.description, url = excluded.url,
+    source_url = excluded.source_url, first_discovered = excluded.first_discovered,
+    last_updated = excluded.last_updated, metadata = excluded.metadata
+'''
+
+# Statements are built once above so every call passes the same text, and
+# with it hits the connection's cache of prepared statements
+STATEMENT_CACHE_SIZE = 256
+
+# Secondary indexes on the sources table, by name
+SOURCE_INDEXES = {
+    'idx_sources_url': 'CREATE INDEX IF NOT EXISTS idx_sources_url ON sources(url)',
+    'idx_sources_last_crawled_ts': 'CREATE INDEX IF NOT EXISTS idx_sources_last_crawled_ts ON sources(last_crawled_ts)',
+}
+
+# Bulk source saves above this many rows rebuild the indexes once instead of updating them per row
+BULK_INDEX_REBUILD_THRESHOLD = 500
+
+# Storages handed out by get_shared_storage, by resolved database path
+_shared_storages: Dict[Path, 'SQLiteStorage'] = {}
+_shared_storages_lock = threading.Lock()
+
+
+def _to_epoch(timestamp: Optional[str]) -> Optional[int]:
     """
-    SQLite storage service for MCP tools and sources.
+    Convert an ISO format timestamp to Unix epoch seconds.
+    
+    Naive timestamps are taken to be UTC, matching datetime.utcnow().
+    
+    Args:
+        timestamp: ISO format timestamp, or None.
+        
+    Returns:
+        Epoch seconds, or None if the timestamp is missing or invalid.
+    """
+    if not timestamp:
+        return None
+    
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _source_rows_by_url(conn: sqlite3.Connection, sources: List[Source]) -> List[Tuple[str, Source]]:
+    """
+    Pair each source with the ID of the row it's saved to, one per URL.
+    
+    url is unique as well as id, so a source whose URL is already stored under
+    another ID updates that row instead of aborting the whole batch. Of several
+    sources with the same URL, the last one wins.
+    
+    Args:
+        conn: Connection to look up the stored IDs with.
+        sources: Sources to save.
+        
+    Returns:
+        (row ID, source) pairs, in first-seen URL order.
+    """
+    stored_ids = {url: source_id for url, source_id in conn.execute('SELECT url, id FROM sources')}
+    
+    rows_by_url = {}
+    for source in sources:
+        rows_by_url[source.url] = (stored_ids.get(source.url, source.id), source)
+    return list(rows_by_url.values())
+
 
 class SQLiteStorage:
     """
-    SQLite storage service for MCP tools.
+    SQLite storage service for MCP tools and sources.
     """
     
     def __init__(self, db_path: Optional[str] = None):
@@ -49,13 +202,38 @@ class SQLiteStorage:
         Args:
             db_path: Path to the SQLite database file. If None, uses the default path.
         """
-        if db_path:
-            self.db_path = Path(db_path)
-        else:
-            self.db_path = Path(__file__).parents[3] / 'data' / 'mcp_crawler.db'
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         
         # Ensure data directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(str(self.db_path.parent))
+        
+        # One connection is kept for the lifetime of the storage, shared across
+        # threads (e.g. executor jobs) and serialized by the lock
+        self._lock = threading.RLock()
+        # Columns are stored as plain TEXT/INTEGER values and converted by the
+        # models, so sqlite3's declared-type converter lookup is left off
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        # Enable foreign keys
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        # Use WAL so a commit appends to the log instead of syncing the database file
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        # Keep temp tables, a 64 MiB page cache and a 256 MiB memory map in memory
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA cache_size = -65536")
+        self._conn.execute("PRAGMA mmap_size = 268435456")
+        # Use Row as row factory for better column access
+        self._conn.row_factory = sqlite3.Row
+        
+        # Started by the first write, since the event loop may not be running yet
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        
+        # Source writes committed through this storage's connection
+        self._source_write_count = 0
         
         # Initialize database
         self._initialize_db()
@@ -63,32 +241,99 @@ class SQLiteStorage:
     @contextmanager
     def get_connection(self):
         """
-        Get a SQLite connection from the connection pool.
+        Get the storage's SQLite connection.
         
-        This uses thread-local storage to ensure each thread has its own connection.
+        The connection is held exclusively until the block exits.
         
         Yields:
             A SQLite connection.
         """
-        # Check if this thread already has a connection
-        if not hasattr(local, 'sqlite_conn'):
-            # Create a new connection for this thread
-            local.sqlite_conn = sqlite3.connect(
-                str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-            )
-            # Enable foreign keys
-            local.sqlite_conn.execute("PRAGMA foreign_keys = ON")
-            # Use Row as row factory for better column access
-            local.sqlite_conn.row_factory = sqlite3.Row
+        with self._lock:
+            try:
+                # Yield the connection for use
+                yield self._conn
+            except Exception as e:
+                # If an error occurs, rollback any changes
+                self._conn.rollback()
+                raise e
+    
+    def close(self):
+        """
+        Stop periodic checkpoints, refresh the planner's statistics, checkpoint the
+        WAL one last time and close the connection.
+        """
+        if self._checkpoint_task is not None and not self._checkpoint_task.done():
+            try:
+                self._checkpoint_task.cancel()
+            except RuntimeError:
+                # The task's event loop is already closed
+                pass
+        self._checkpoint_task = None
         
-        try:
-            # Yield the connection for use
-            yield local.sqlite_conn
-        except Exception as e:
-            # If an error occurs, rollback any changes
-            local.sqlite_conn.rollback()
-            raise e
+        # Later get_shared_storage calls open a new storage rather than returning this closed one
+        with _shared_storages_lock:
+            if _shared_storages.get(self.db_path.resolve()) is self:
+                del _shared_storages[self.db_path.resolve()]
+        
+        with self._lock:
+            # Let SQLite analyze any tables whose statistics are stale
+            self._conn.execute("PRAGMA optimize")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+    
+    def sources_version(self) -> Tuple[int, int]:
+        """
+        Get the version of the stored sources.
+        
+        PRAGMA data_version only changes when another connection commits, so
+        source writes through this storage are counted separately.
+        
+        Returns:
+            Tuple of this storage's source write count and the database's data version.
+        """
+        with self.get_connection() as conn:
+            return self._source_write_count, conn.execute('PRAGMA data_version').fetchone()[0]
+    
+    def checkpoint(self):
+        """
+        Copy the WAL into the database file and truncate it.
+        
+        SQLite's automatic checkpoints are passive and are skipped while readers are
+        active, so a long-running process can otherwise grow the WAL without bound.
+        """
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    async def _checkpoint_loop(self, interval: int):
+        """
+        Checkpoint the WAL every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds between checkpoints.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await loop.run_in_executor(None, self.checkpoint)
+            except Exception as e:
+                logger.warning(f"Error checkpointing SQLite WAL: {str(e)}")
+    
+    def _start_checkpointing(self):
+        """
+        Start the periodic WAL checkpoint task if it isn't running on this event loop.
+        
+        A shared storage outlives the event loop of each asyncio.run, which ends
+        its task, so a later loop starts a new one.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._checkpoint_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        
+        interval = config['storage']['sqlite'].get('checkpoint_interval', 0)
+        if interval > 0:
+            self._checkpoint_task = loop.create_task(self._checkpoint_loop(interval))
     
     def _initialize_db(self):
         """
@@ -107,11 +352,22 @@ class SQLiteStorage:
                 has_known_crawler BOOLEAN NOT NULL,
                 crawler_id TEXT,
                 last_crawled TEXT,
+                last_crawled_ts INTEGER,
                 last_crawl_status TEXT,
                 metadata TEXT
             )
             ''')
             
+            # Databases created before last_crawled_ts existed get it added and backfilled
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(sources)')}
+            if 'last_crawled_ts' not in columns:
+                cursor.execute('ALTER TABLE sources ADD COLUMN last_crawled_ts INTEGER')
+                cursor.execute('''
+                UPDATE sources
+                SET last_crawled_ts = CAST(strftime('%s', last_crawled) AS INTEGER)
+                WHERE last_crawled IS NOT NULL
+                ''')
+            
             # Create tools table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS tools (
@@ -156,12 +412,24 @@ class SQLiteStorage:
             )
             ''')
             
+            # Create _meta table for small key/value bookkeeping
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS _meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            ''')
+            
             # Create indexes for common queries
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sources_url ON sources(url)')
+            cursor.execute('DROP INDEX IF EXISTS idx_sources_last_crawled')
+            for create_index in SOURCE_INDEXES.values():
+                cursor.execute(create_index)
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tools_url ON tools(url)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tools_source_url ON tools(source_url)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_crawler_strategies_source_id ON crawler_strategies(source_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_crawl_results_source_id ON crawl_results(source_id)')
+            # Serves both the source filter and the newest-first ordering of crawl result lookups
+            cursor.execute('DROP INDEX IF EXISTS idx_crawl_results_source_id')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_crawl_results_source_id_timestamp ON crawl_results(source_id, timestamp DESC)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_crawl_results_timestamp ON crawl_results(timestamp)')
             
             conn.commit()
@@ -175,89 +443,94 @@ class SQLiteStorage:
         
         Args:
             source: Source to save.
-            db_path: Path to the SQLite database file. If None, uses the value from config.
+            
+        Returns:
+            True if successful, False otherwise.
         """
-        self.db_path = db_path or config['storage']['sqlite']['db_path']
-        self._ensure_db_exists()
+        try:
+            with self.get_connection() as conn:
+                # Convert metadata to JSON string
+                metadata_json = _dumps_json(source.metadata) if source.metadata else '{}'
+                
+                conn.execute(UPSERT_SOURCE, (
+                    source.id, source.url, source.name, source.type.value, source.has_known_crawler,
+                    source.crawler_id, source.last_crawled, _to_epoch(source.last_crawled),
+                    source.last_crawl_status, metadata_json
+                ))
+                
+                conn.commit()
+                self._source_write_count += 1
+                logger.info(f"Saved source: {source.name} ({source.url})")
+                return True
+        except Exception as e:
+            logger.error(f"Error saving source: {str(e)}")
+            return False
     
-    def _ensure_db_exists(self):
+    async def save_sources_bulk(self, sources: List[Source]) -> bool:
         """
-        Ensure the database file and tables exist.
+        Save multiple sources to the database in a single transaction.
+        
+        Existing sources with the same ID or URL are updated in place.
+        
+        Args:
+            sources: Sources to save.
+            
+        Returns:
+            True if successful, False otherwise.
         """
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        # Connect to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create tools table if it doesn't exist
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tools (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            description TEXT NOT NULL,
-            url TEXT NOT NULL,
-            source_url TEXT NOT NULL,
-            first_discovered TEXT NOT NULL,
-            last_updated TEXT NOT NULL,
-            metadata TEXT NOT NULL
-        )
-        ''')
+        if not sources:
+            return True
         
-        conn.commit()
-        conn.close()
+        self._start_checkpointing()
         
-        logger.info(f"Ensured SQLite database exists at {self.db_path}")
+        # Large batches block for a while, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_sources_bulk, sources)
     
-    async def save_tools(self, tools: List[MCPTool]) -> bool:
+    def _save_sources_bulk(self, sources: List[Source]) -> bool:
         """
-        Save tools to SQLite.
+        Blocking implementation of save_sources_bulk.
         
         Args:
-            tools: List of tools to save.
+            sources: Sources to save.
             
         Returns:
             True if successful, False otherwise.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                conn.execute('BEGIN IMMEDIATE')
+                
+                rows = [
+                    (
+                        source_id, source.url, source.name, source.type.value, source.has_known_crawler,
+                        source.crawler_id, source.last_crawled, _to_epoch(source.last_crawled),
+                        source.last_crawl_status,
+                        _dumps_json(source.metadata) if source.metadata else '{}'
+                    )
+                    for source_id, source in _source_rows_by_url(conn, sources)
+                ]
                 
-                # Convert metadata to JSON string
-                metadata_json = json.dumps(source.metadata) if source.metadata else '{}'
+                rebuild_indexes = len(rows) > BULK_INDEX_REBUILD_THRESHOLD
                 
-                # Check if source already exists
-                cursor.execute('SELECT id FROM sources WHERE id = ?', (source.id,))
-                exists = cursor.fetchone() is not None
+                if rebuild_indexes:
+                    for index_name in SOURCE_INDEXES:
+                        conn.execute(f'DROP INDEX IF EXISTS {index_name}')
                 
-                if exists:
-                    # Update existing source
-                    cursor.execute('''
-                    UPDATE sources
-                    SET url = ?, name = ?, type = ?, has_known_crawler = ?,
-                        crawler_id = ?, last_crawled = ?, last_crawl_status = ?, metadata = ?
-                    WHERE id = ?
-                    ''', (
-                        source.url, source.name, source.type.value, source.has_known_crawler,
-                        source.crawler_id, source.last_crawled, source.last_crawl_status, metadata_json,
-                        source.id
-                    ))
-                else:
-                    # Insert new source
-                    cursor.execute('''
-                    INSERT INTO sources (id, url, name, type, has_known_crawler, crawler_id, last_crawled, last_crawl_status, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        source.id, source.url, source.name, source.type.value, source.has_known_crawler,
-                        source.crawler_id, source.last_crawled, source.last_crawl_status, metadata_json
-                    ))
+                conn.executemany(UPSERT_SOURCE, rows)
                 
+                if rebuild_indexes:
+                    for create_index in SOURCE_INDEXES.values():
+                        conn.execute(create_index)
+                    # Refresh the planner's statistics for the rebuilt indexes
+                    conn.execute('ANALYZE sources')
                 conn.commit()
-                logger.info(f"{'Updated' if exists else 'Saved'} source: {source.name} ({source.url})")
+                self._source_write_count += 1
+                
+                logger.info(f"Saved {len(rows)} sources to SQLite")
                 return True
         except Exception as e:
-            logger.error(f"Error saving source: {str(e)}")
+            logger.error(f"Error saving sources: {str(e)}")
             return False
     
     async def get_source(self, source_id: str) -> Optional[Source]:
@@ -274,20 +547,11 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM sources WHERE id = ?', (source_id,))
+                cursor.execute(SELECT_SOURCE_BY_ID, (source_id,))
                 row = cursor.fetchone()
                 
                 if row:
-                    # Convert row to dict
-                    source_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    source_dict['metadata'] = json.loads(source_dict['metadata']) if source_dict['metadata'] else {}
-                    
-                    # Convert type string to enum
-                    source_dict['type'] = SourceType(source_dict['type'])
-                    
-                    return Source(**source_dict)
+                    return Source.from_row(row)
                 
                 return None
         except Exception as e:
@@ -308,20 +572,11 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM sources WHERE url = ?', (url,))
+                cursor.execute(SELECT_SOURCE_BY_URL, (url,))
                 row = cursor.fetchone()
                 
                 if row:
-                    # Convert row to dict
-                    source_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    source_dict['metadata'] = json.loads(source_dict['metadata']) if source_dict['metadata'] else {}
-                    
-                    # Convert type string to enum
-                    source_dict['type'] = SourceType(source_dict['type'])
-                    
-                    return Source(**source_dict)
+                    return Source.from_row(row)
                 
                 return None
         except Exception as e:
@@ -332,6 +587,17 @@ class SQLiteStorage:
         """
         Get all sources from the database.
         
+        Returns:
+            List of all sources.
+        """
+        # Reading the whole table blocks for a while, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_all_sources)
+    
+    def _get_all_sources(self) -> List[Source]:
+        """
+        Blocking implementation of get_all_sources.
+        
         Returns:
             List of all sources.
         """
@@ -339,21 +605,8 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM sources')
-                rows = cursor.fetchall()
-                
-                sources = []
-                for row in rows:
-                    # Convert row to dict
-                    source_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    source_dict['metadata'] = json.loads(source_dict['metadata']) if source_dict['metadata'] else {}
-                    
-                    # Convert type string to enum
-                    source_dict['type'] = SourceType(source_dict['type'])
-                    
-                    sources.append(Source(**source_dict))
+                cursor.execute(SELECT_SOURCES)
+                sources = [Source.from_row(row) for row in cursor]
                 
                 logger.info(f"Retrieved {len(sources)} sources from SQLite")
                 return sources
@@ -361,41 +614,58 @@ class SQLiteStorage:
             logger.error(f"Error getting all sources: {str(e)}")
             return []
     
-    async def get_sources_to_crawl(self, time_threshold: str) -> List[Source]:
+    async def get_all_source_urls(self) -> Set[str]:
+        """
+        Get the URLs of all sources in the database.
+        
+        Returns:
+            Set of source URLs.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute('SELECT url FROM sources')
+                return {row[0] for row in cursor}
+        except Exception as e:
+            logger.error(f"Error getting source URLs: {str(e)}")
+            return set()
+    
+    async def get_sources_to_crawl(self, time_threshold: Union[int, str]) -> List[Source]:
         """
         Get sources that need to be crawled.
         
         Args:
-            time_threshold: ISO format timestamp. Sources that haven't been
-                           crawled since this time will be returned.
+            time_threshold: Unix epoch seconds or ISO format timestamp. Sources
+                           that haven't been crawled since this time will be returned.
+            
+        Returns:
+            List of sources to crawl.
+        """
+        # Scanning for stale sources blocks for a while, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_sources_to_crawl, time_threshold)
+    
+    def _get_sources_to_crawl(self, time_threshold: Union[int, str]) -> List[Source]:
+        """
+        Blocking implementation of get_sources_to_crawl.
+        
+        Args:
+            time_threshold: Unix epoch seconds or ISO format timestamp. Sources
+                           that haven't been crawled since this time will be returned.
             
         Returns:
             List of sources to crawl.
         """
         try:
+            if isinstance(time_threshold, str):
+                time_threshold = _to_epoch(time_threshold)
+            
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get sources that have never been crawled or were crawled before the threshold
-                cursor.execute('''
-                SELECT * FROM sources
-                WHERE last_crawled IS NULL OR last_crawled < ?
-                ''', (time_threshold,))
+                cursor.execute(SELECT_SOURCES_TO_CRAWL, (time_threshold,))
                 
-                rows = cursor.fetchall()
-                
-                sources = []
-                for row in rows:
-                    # Convert row to dict
-                    source_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    source_dict['metadata'] = json.loads(source_dict['metadata']) if source_dict['metadata'] else {}
-                    
-                    # Convert type string to enum
-                    source_dict['type'] = SourceType(source_dict['type'])
-                    
-                    sources.append(Source(**source_dict))
+                sources = [Source.from_row(row) for row in cursor]
                 
                 logger.info(f"Found {len(sources)} sources to crawl")
                 return sources
@@ -414,30 +684,62 @@ class SQLiteStorage:
         Returns:
             True if successful, False otherwise.
         """
+        if await self.update_sources_last_crawl([(source_id, success)]) == 0:
+            logger.warning(f"No source found with ID {source_id} to update last crawl")
+            return False
+        
+        return True
+    
+    async def update_sources_last_crawl(self, updates: List[Tuple[str, bool]]) -> int:
+        """
+        Update the last crawl information of multiple sources in a single transaction.
+        
+        Args:
+            updates: (source ID, whether the crawl was successful) pairs.
+            
+        Returns:
+            Number of sources updated.
+        """
+        if not updates:
+            return 0
+        
+        self._start_checkpointing()
+        
+        # Large batches block for a while, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._update_sources_last_crawl, updates)
+    
+    def _update_sources_last_crawl(self, updates: List[Tuple[str, bool]]) -> int:
+        """
+        Blocking implementation of update_sources_last_crawl.
+        
+        Args:
+            updates: (source ID, whether the crawl was successful) pairs.
+            
+        Returns:
+            Number of sources updated.
+        """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                now = datetime.now(timezone.utc)
+                timestamp = now.replace(tzinfo=None).isoformat()
+                epoch = int(now.timestamp())
                 
-                timestamp = datetime.utcnow().isoformat()
-                status = 'success' if success else 'failed'
-                
-                cursor.execute('''
-                UPDATE sources
-                SET last_crawled = ?, last_crawl_status = ?
-                WHERE id = ?
-                ''', (timestamp, status, source_id))
+                rows = [
+                    (timestamp, epoch, 'success' if success else 'failed', source_id)
+                    for source_id, success in updates
+                ]
                 
+                conn.execute('BEGIN IMMEDIATE')
+                cursor = conn.executemany(UPDATE_SOURCE_LAST_CRAWL, rows)
                 conn.commit()
+                self._source_write_count += 1
                 
-                if cursor.rowcount == 0:
-                    logger.warning(f"No source found with ID {source_id} to update last crawl")
-                    return False
-                
-                logger.info(f"Updated last crawl for source {source_id}")
-                return True
+                logger.info(f"Updated last crawl for {cursor.rowcount} sources")
+                return cursor.rowcount
         except Exception as e:
             logger.error(f"Error updating source last crawl: {str(e)}")
-            return False
+            return 0
     
     async def delete_source(self, source_id: str) -> bool:
         """
@@ -455,6 +757,7 @@ class SQLiteStorage:
                 
                 cursor.execute('DELETE FROM sources WHERE id = ?', (source_id,))
                 conn.commit()
+                self._source_write_count += 1
                 
                 if cursor.rowcount == 0:
                     logger.warning(f"No source found with ID {source_id} to delete")
@@ -470,7 +773,26 @@ class SQLiteStorage:
     
     async def save_tools(self, tools: List[MCPTool]) -> bool:
         """
-        Save tools to the database.
+        Save tools to the database in a single transaction.
+        
+        Existing tools with the same ID are updated in place.
+        
+        Args:
+            tools: List of tools to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not tools:
+            return True
+        
+        # Large catalogs block for a while, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_tools, tools)
+    
+    def _save_tools(self, tools: List[MCPTool]) -> bool:
+        """
+        Blocking implementation of save_tools.
         
         Args:
             tools: List of tools to save.
@@ -479,40 +801,20 @@ class SQLiteStorage:
             True if successful, False otherwise.
         """
         try:
+            rows = [
+                (
+                    tool.id, tool.name, tool.description, tool.url, tool.source_url,
+                    tool.first_discovered, tool.last_updated,
+                    _dumps_json(tool.metadata) if tool.metadata else '{}'
+                )
+                for tool in tools
+            ]
+            
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                for tool in tools:
-                    # Convert metadata to JSON string
-                    metadata_json = json.dumps(tool.metadata) if tool.metadata else '{}'
-                    
-                    # Check if tool already exists
-                    cursor.execute('SELECT id FROM tools WHERE id = ?', (tool.id,))
-                    exists = cursor.fetchone() is not None
-                    
-                    if exists:
-                        # Update existing tool
-                        cursor.execute('''
-                        UPDATE tools
-                        SET name = ?, description = ?, url = ?, source_url = ?,
-                            first_discovered = ?, last_updated = ?, metadata = ?
-                        WHERE id = ?
-                        ''', (
-                            tool.name, tool.description, tool.url, tool.source_url,
-                            tool.first_discovered, tool.last_updated, metadata_json,
-                            tool.id
-                        ))
-                    else:
-                        # Insert new tool
-                        cursor.execute('''
-                        INSERT INTO tools (id, name, description, url, source_url, first_discovered, last_updated, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            tool.id, tool.name, tool.description, tool.url, tool.source_url,
-                            tool.first_discovered, tool.last_updated, metadata_json
-                        ))
-                
+                conn.execute('BEGIN IMMEDIATE')
+                conn.executemany(UPSERT_TOOL, rows)
                 conn.commit()
+                
                 logger.info(f"Saved {len(tools)} tools to SQLite")
                 return True
         except Exception as e:
@@ -523,6 +825,17 @@ class SQLiteStorage:
         """
         Load all tools from the database.
         
+        Returns:
+            List of tools loaded from the database.
+        """
+        # Large catalogs block for a while, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_tools)
+    
+    def _load_tools(self) -> List[MCPTool]:
+        """
+        Blocking implementation of load_tools.
+        
         Returns:
             List of tools loaded from the database.
         """
@@ -530,18 +843,8 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM tools')
-                rows = cursor.fetchall()
-                
-                tools = []
-                for row in rows:
-                    # Convert row to dict
-                    tool_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    tool_dict['metadata'] = json.loads(tool_dict['metadata']) if tool_dict['metadata'] else {}
-                    
-                    tools.append(MCPTool(**tool_dict))
+                cursor.execute(SELECT_TOOLS)
+                tools = [MCPTool.from_row(row) for row in cursor]
                 
                 logger.info(f"Loaded {len(tools)} tools from SQLite")
                 return tools
@@ -563,19 +866,10 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM tools WHERE id = ?', (tool_id,))
+                cursor.execute(SELECT_TOOL_BY_ID, (tool_id,))
                 row = cursor.fetchone()
                 
-                if row:
-                    # Convert row to dict
-                    tool_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    tool_dict['metadata'] = json.loads(tool_dict['metadata']) if tool_dict['metadata'] else {}
-                    
-                    return MCPTool(**tool_dict)
-                
-                return None
+                return MCPTool.from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting tool: {str(e)}")
             return None
@@ -594,19 +888,10 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM tools WHERE url = ?', (url,))
+                cursor.execute(SELECT_TOOL_BY_URL, (url,))
                 row = cursor.fetchone()
                 
-                if row:
-                    # Convert row to dict
-                    tool_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    tool_dict['metadata'] = json.loads(tool_dict['metadata']) if tool_dict['metadata'] else {}
-                    
-                    return MCPTool(**tool_dict)
-                
-                return None
+                return MCPTool.from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting tool by URL: {str(e)}")
             return None
@@ -615,6 +900,20 @@ class SQLiteStorage:
         """
         Get tools by source URL.
         
+        Args:
+            source_url: Source URL to filter by.
+            
+        Returns:
+            List of tools from the specified source.
+        """
+        # Sources can list many tools, so keep the read off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_tools_by_source_url, source_url)
+    
+    def _get_tools_by_source_url(self, source_url: str) -> List[MCPTool]:
+        """
+        Blocking implementation of get_tools_by_source_url.
+        
         Args:
             source_url: Source URL to filter by.
             
@@ -625,18 +924,8 @@ class SQLiteStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM tools WHERE source_url = ?', (source_url,))
-                rows = cursor.fetchall()
-                
-                tools = []
-                for row in rows:
-                    # Convert row to dict
-                    tool_dict = dict(row)
-                    
-                    # Parse metadata JSON
-                    tool_dict['metadata'] = json.loads(tool_dict['metadata']) if tool_dict['metadata'] else {}
-                    
-                    tools.append(MCPTool(**tool_dict))
+                cursor.execute(SELECT_TOOLS_BY_SOURCE_URL, (source_url,))
+                tools = [MCPTool.from_row(row) for row in cursor]
                 
                 logger.info(f"Retrieved {len(tools)} tools from source URL: {source_url}")
                 return tools
@@ -679,169 +968,19 @@ class SQLiteStorage:
         
         Args:
             strategy: Crawler strategy to save.
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            for tool in tools:
-                tool_dict = tool.dict()
-                metadata_json = json.dumps(tool_dict.get('metadata', {}))
-                
-                # Check if tool already exists
-                cursor.execute('SELECT id FROM tools WHERE id = ?', (tool.id,))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing tool
-                    cursor.execute('''
-                    UPDATE tools
-                    SET name = ?, description = ?, url = ?, source_url = ?,
-                        last_updated = ?, metadata = ?
-                    WHERE id = ?
-                    ''', (
-                        tool.name, tool.description, tool.url, tool.source_url,
-                        tool.last_updated, metadata_json, tool.id
-                    ))
-                else:
-                    # Insert new tool
-                    cursor.execute('''
-                    INSERT INTO tools (id, name, description, url, source_url,
-                                      first_discovered, last_updated, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        tool.id, tool.name, tool.description, tool.url, tool.source_url,
-                        tool.first_discovered, tool.last_updated, metadata_json
-                    ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Saved {len(tools)} tools to SQLite database")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving tools to SQLite: {str(e)}")
-            return False
-    
-    async def load_tools(self) -> List[MCPTool]:
-        """
-        Load tools from SQLite.
-        
-        Returns:
-            List of tools loaded from SQLite.
-        """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM tools')
-            rows = cursor.fetchall()
-            
-            tools = []
-            for row in rows:
-                row_dict = dict(row)
-                # Parse metadata JSON
-                row_dict['metadata'] = json.loads(row_dict['metadata'])
-                tools.append(MCPTool(**row_dict))
-            
-            conn.close()
-            
-            logger.info(f"Loaded {len(tools)} tools from SQLite database")
-            return tools
-        except Exception as e:
-            logger.error(f"Error loading tools from SQLite: {str(e)}")
-            return []
-
-
-class SQLiteSourceStorage:
-    """
-    SQLite storage service for source lists.
-    """
-    
-    def __init__(self, db_path: Optional[str] = None, sources_file_path: Optional[str] = None):
-        """
-        Initialize the SQLite source storage service.
-        
-        Args:
-            db_path: Path to the SQLite database file. If None, uses the value from config.
-            sources_file_path: Path to the sources YAML file. If None, uses the value from config.
-        """
-        self.db_path = db_path or config['storage']['sqlite']['db_path']
-        self.sources_file_path = sources_file_path or config['storage']['local']['sources_file_path']
-        self._ensure_db_exists()
-    
-    def _ensure_db_exists(self):
-        """
-        Ensure the database file and tables exist.
-        """
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        # Connect to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create sources table if it doesn't exist
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sources (
-            id TEXT PRIMARY KEY,
-            url TEXT NOT NULL,
-            name TEXT NOT NULL,
-            type TEXT NOT NULL,
-            has_known_crawler INTEGER NOT NULL,
-            crawler_id TEXT,
-            last_crawled TEXT,
-            last_crawl_status TEXT,
-            metadata TEXT NOT NULL
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"Ensured SQLite database exists at {self.db_path}")
-    
-    async def save_sources(self, sources: List[Source]) -> bool:
-        """
-        Save sources to SQLite and optionally to a YAML file.
-        
-        Args:
-            sources: List of sources to save.
             
         Returns:
             True if successful, False otherwise.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check if strategy already exists
-                cursor.execute('SELECT id FROM crawler_strategies WHERE id = ?', (strategy.id,))
-                exists = cursor.fetchone() is not None
-                
-                if exists:
-                    # Update existing strategy
-                    cursor.execute('''
-                    UPDATE crawler_strategies
-                    SET source_id = ?, source_type = ?, implementation = ?,
-                        description = ?, created = ?, last_modified = ?
-                    WHERE id = ?
-                    ''', (
-                        strategy.source_id, strategy.source_type.value, strategy.implementation,
-                        strategy.description, strategy.created, strategy.last_modified,
-                        strategy.id
-                    ))
-                else:
-                    # Insert new strategy
-                    cursor.execute('''
-                    INSERT INTO crawler_strategies (id, source_id, source_type, implementation, description, created, last_modified)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        strategy.id, strategy.source_id, strategy.source_type.value, strategy.implementation,
-                        strategy.description, strategy.created, strategy.last_modified
-                    ))
+                conn.execute(UPSERT_CRAWLER_STRATEGY, (
+                    strategy.id, strategy.source_id, strategy.source_type.value, strategy.implementation,
+                    strategy.description, strategy.created, strategy.last_modified
+                ))
                 
                 conn.commit()
-                logger.info(f"{'Updated' if exists else 'Saved'} crawler strategy for source ID: {strategy.source_id}")
+                logger.info(f"Saved crawler strategy for source ID: {strategy.source_id}")
                 return True
         except Exception as e:
             logger.error(f"Error saving crawler strategy: {str(e)}")
@@ -861,19 +1000,10 @@ class SQLiteSourceStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM crawler_strategies WHERE id = ?', (strategy_id,))
+                cursor.execute(SELECT_CRAWLER_STRATEGY_BY_ID, (strategy_id,))
                 row = cursor.fetchone()
                 
-                if row:
-                    # Convert row to dict
-                    strategy_dict = dict(row)
-                    
-                    # Convert source_type string to enum
-                    strategy_dict['source_type'] = SourceType(strategy_dict['source_type'])
-                    
-                    return CrawlerStrategy(**strategy_dict)
-                
-                return None
+                return CrawlerStrategy.from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting crawler strategy: {str(e)}")
             return None
@@ -892,19 +1022,10 @@ class SQLiteSourceStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT * FROM crawler_strategies WHERE source_id = ?', (source_id,))
+                cursor.execute(SELECT_CRAWLER_STRATEGY_BY_SOURCE, (source_id,))
                 row = cursor.fetchone()
                 
-                if row:
-                    # Convert row to dict
-                    strategy_dict = dict(row)
-                    
-                    # Convert source_type string to enum
-                    strategy_dict['source_type'] = SourceType(strategy_dict['source_type'])
-                    
-                    return CrawlerStrategy(**strategy_dict)
-                
-                return None
+                return CrawlerStrategy.from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting crawler strategy by source ID: {str(e)}")
             return None
@@ -948,14 +1069,13 @@ class SQLiteSourceStorage:
         Returns:
             True if successful, False otherwise.
         """
+        self._start_checkpointing()
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                INSERT INTO crawl_results (source_id, timestamp, success, tools_discovered, new_tools, updated_tools, duration, error)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(INSERT_CRAWL_RESULT, (
                     result.source_id, result.timestamp, result.success, result.tools_discovered,
                     result.new_tools, result.updated_tools, result.duration, result.error
                 ))
@@ -967,40 +1087,28 @@ class SQLiteSourceStorage:
             logger.error(f"Error saving crawl result: {str(e)}")
             return False
     
-    async def get_crawl_results_by_source_id(self, source_id: str, limit: int = 10) -> List[CrawlResult]:
+    async def get_crawl_results_by_source_id(self, source_id: str, limit: int = 10,
+                                             before: Optional[str] = None) -> List[CrawlResult]:
         """
-        Get crawl results by source ID.
+        Get crawl results by source ID, newest first.
         
         Args:
             source_id: ID of the source to get crawl results for.
             limit: Maximum number of results to return.
+            before: Only return results older than this timestamp. Pass the timestamp
+                    of the last result of a page to get the next page.
             
         Returns:
             List of crawl results for the specified source.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                SELECT * FROM crawl_results
-                WHERE source_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                ''', (source_id, limit))
-                
-                rows = cursor.fetchall()
+                if before is None:
+                    cursor = conn.execute(SELECT_CRAWL_RESULTS_BY_SOURCE, (source_id, limit))
+                else:
+                    cursor = conn.execute(SELECT_CRAWL_RESULTS_BY_SOURCE_BEFORE, (source_id, before, limit))
                 
-                results = []
-                for row in rows:
-                    # Convert row to dict
-                    result_dict = dict(row)
-                    
-                    # Remove the auto-generated ID
-                    if 'id' in result_dict:
-                        del result_dict['id']
-                    
-                    results.append(CrawlResult(**result_dict))
+                results = [CrawlResult.from_row(row) for row in cursor]
                 
                 logger.info(f"Retrieved {len(results)} crawl results for source ID: {source_id}")
                 return results
@@ -1022,73 +1130,231 @@ class SQLiteSourceStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                SELECT * FROM crawl_results
-                WHERE source_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                ''', (source_id,))
+                cursor.execute(SELECT_CRAWL_RESULTS_BY_SOURCE, (source_id, 1))
                 
                 row = cursor.fetchone()
                 
-                if row:
-                    # Convert row to dict
-                    result_dict = dict(row)
-                    
-                    # Remove the auto-generated ID
-                    if 'id' in result_dict:
-                        del result_dict['id']
-                    
-                    return CrawlResult(**result_dict)
-                
-                return None
+                return CrawlResult.from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting latest crawl result by source ID: {str(e)}")
             return None
-            conn = sqlite3.connect(self.db_path)
+    
+    # Meta methods
+    
+    async def get_meta(self, key: str) -> Optional[str]:
+        """
+        Get a bookkeeping value.
+        
+        Args:
+            key: Key of the value to get.
+            
+        Returns:
+            The value if set, None otherwise.
+        """
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('SELECT value FROM _meta WHERE key = ?', (key,)).fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Error getting meta value {key}: {str(e)}")
+            return None
+    
+    async def set_meta(self, key: str, value: str) -> bool:
+        """
+        Set a bookkeeping value.
+        
+        Args:
+            key: Key of the value to set.
+            value: Value to set.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute('INSERT OR REPLACE INTO _meta (key, value) VALUES (?, ?)', (key, value))
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error setting meta value {key}: {str(e)}")
+            return False
+
+
+def get_shared_storage(db_path: Path) -> SQLiteStorage:
+    """
+    Get the shared SQLite storage service for a resolved database path.
+    
+    The storage stays shared until it is closed; the next call after that opens a
+    new one.
+    
+    Args:
+        db_path: Resolved path to the SQLite database file.
+    
+    Returns:
+        The SQLite storage service for the database.
+    """
+    with _shared_storages_lock:
+        storage = _shared_storages.get(db_path)
+        if storage is None:
+            storage = _shared_storages[db_path] = SQLiteStorage(str(db_path))
+        return storage
+
+
+class SQLiteSourceStorage:
+    """
+    SQLite storage service for source lists.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None, sources_file_path: Optional[str] = None):
+        """
+        Initialize the SQLite source storage service.
+        
+        Args:
+            db_path: Path to the SQLite database file. If None, uses the value from config.
+            sources_file_path: Path to the sources YAML file. If None, uses the value from config.
+        """
+        self.db_path = db_path or config['storage']['sqlite']['db_path']
+        self.sources_file_path = sources_file_path or config['storage']['local']['sources_file_path']
+        # Saves committed through this storage's connection
+        self._save_count = 0
+        self._ensure_db_exists()
+    
+    @contextmanager
+    def get_connection(self):
+        """
+        Get the storage's SQLite connection.
+        
+        The connection is held exclusively until the block exits.
+        
+        Yields:
+            A SQLite connection.
+        """
+        with self._lock:
+            try:
+                yield self._conn
+            except Exception as e:
+                self._conn.rollback()
+                raise e
+    
+    def close(self):
+        """
+        Close the storage's SQLite connection.
+        """
+        with self._lock:
+            self._conn.close()
+    
+    def version(self) -> Tuple[int, int]:
+        """
+        Get the version of the stored sources.
+        
+        PRAGMA data_version only changes when another connection commits, so
+        this storage's own saves are counted separately.
+        
+        Returns:
+            Tuple of this storage's save count and the database's data version.
+        """
+        with self.get_connection() as conn:
+            return self._save_count, conn.execute('PRAGMA data_version').fetchone()[0]
+    
+    def _ensure_db_exists(self):
+        """
+        Open the storage's connection and ensure the database file and tables exist.
+        """
+        # Ensure directory exists
+        ensure_directory(os.path.dirname(self.db_path))
+        
+        # Keep one connection for the lifetime of the storage, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA cache_size = -20000")
+        self._conn.row_factory = sqlite3.Row
+        
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            for source in sources:
-                source_dict = source.dict()
-                metadata_json = json.dumps(source_dict.get('metadata', {}))
-                
-                # Check if source already exists
-                cursor.execute('SELECT id FROM sources WHERE id = ?', (source.id,))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing source
-                    cursor.execute('''
-                    UPDATE sources
-                    SET url = ?, name = ?, type = ?, has_known_crawler = ?,
-                        crawler_id = ?, last_crawled = ?, last_crawl_status = ?, metadata = ?
-                    WHERE id = ?
-                    ''', (
-                        source.url, source.name, source.type.value, 
-                        1 if source.has_known_crawler else 0,
-                        source.crawler_id, source.last_crawled, source.last_crawl_status,
-                        metadata_json, source.id
-                    ))
-                else:
-                    # Insert new source
-                    cursor.execute('''
-                    INSERT INTO sources (id, url, name, type, has_known_crawler,
-                                        crawler_id, last_crawled, last_crawl_status, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        source.id, source.url, source.name, source.type.value,
-                        1 if source.has_known_crawler else 0,
-                        source.crawler_id, source.last_crawled, source.last_crawl_status,
-                        metadata_json
-                    ))
+            # Create sources table if it doesn't exist
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sources (
+                id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                name TEXT NOT NULL,
+                type TEXT NOT NULL,
+                has_known_crawler INTEGER NOT NULL,
+                crawler_id TEXT,
+                last_crawled TEXT,
+                last_crawl_status TEXT,
+                metadata TEXT NOT NULL
+            )
+            ''')
             
             conn.commit()
-            conn.close()
+        
+        logger.info(f"Ensured SQLite database exists at {self.db_path}")
+    
+    async def save_sources(self, sources: List[Source]) -> bool:
+        """
+        Save sources to SQLite and optionally to a YAML file.
+        
+        Args:
+            sources: List of sources to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        # The database commit and YAML write block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._save_sources, sources)
+    
+    def _save_sources(self, sources: List[Source]) -> bool:
+        """
+        Blocking implementation of save_sources.
+        
+        Args:
+            sources: List of sources to save.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                rows = [
+                    (
+                        source_id, source.url, source.name, source.type.value,
+                        1 if source.has_known_crawler else 0,
+                        source.crawler_id, source.last_crawled, source.last_crawl_status,
+                        _dumps_json(source.metadata or {})
+                    )
+                    for source_id, source in _source_rows_by_url(conn, sources)
+                ]
+                conn.executemany('''
+                INSERT INTO sources (id, url, name, type, has_known_crawler,
+                                    crawler_id, last_crawled, last_crawl_status, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    url = excluded.url, name = excluded.name, type = excluded.type,
+                    has_known_crawler = excluded.has_known_crawler, crawler_id = excluded.crawler_id,
+                    last_crawled = excluded.last_crawled, last_crawl_status = excluded.last_crawl_status,
+                    metadata = excluded.metadata
+                -- Leave unchanged rows alone instead of rewriting them
+                WHERE (url, name, type, has_known_crawler, crawler_id,
+                       last_crawled, last_crawl_status, metadata)
+                   IS NOT (excluded.url, excluded.name, excluded.type, excluded.has_known_crawler,
+                           excluded.crawler_id, excluded.last_crawled, excluded.last_crawl_status,
+                           excluded.metadata)
+                ''', rows)
+                conn.commit()
+                self._save_count += 1
             
             # Also save to YAML file if configured
             if self.sources_file_path:
                 # Ensure directory exists
-                os.makedirs(os.path.dirname(self.sources_file_path), exist_ok=True)
+                ensure_directory(os.path.dirname(self.sources_file_path))
                 
                 # Convert sources to dict for YAML
                 sources_data = {
@@ -1104,11 +1370,11 @@ class SQLiteSourceStorage:
                 
                 # Write to YAML file
                 with open(self.sources_file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(sources_data, f, default_flow_style=False)
+                    yaml.dump(sources_data, f, Dumper=YamlDumper, default_flow_style=False)
                 
                 logger.info(f"Saved {len(sources)} sources to YAML file: {self.sources_file_path}")
             
-            logger.info(f"Saved {len(sources)} sources to SQLite database")
+            logger.info(f"Saved {len(rows)} sources to SQLite database")
             return True
         except Exception as e:
             logger.error(f"Error saving sources to SQLite: {str(e)}")
@@ -1123,26 +1389,14 @@ class SQLiteSourceStorage:
         """
         # Try loading from SQLite first
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM sources')
-            rows = cursor.fetchall()
+            with self.get_connection() as conn:
+                rows = conn.execute(SELECT_SOURCES).fetchall()
             
             if rows:
                 sources = []
                 for row in rows:
-                    row_dict = dict(row)
-                    # Convert has_known_crawler from integer to boolean
-                    row_dict['has_known_crawler'] = bool(row_dict['has_known_crawler'])
-                    # Parse metadata JSON
-                    row_dict['metadata'] = json.loads(row_dict['metadata'])
-                    # Convert type string to enum
-                    row_dict['type'] = SourceType(row_dict['type'])
-                    sources.append(Source(**row_dict))
+                    sources.append(Source.from_row(row))
                 
-                conn.close()
                 logger.info(f"Loaded {len(sources)} sources from SQLite database")
                 return sources
         except Exception as e:
@@ -1151,52 +1405,10 @@ class SQLiteSourceStorage:
         # If SQLite failed or returned no sources, try loading from YAML file
         try:
             if os.path.exists(self.sources_file_path):
-                with open(self.sources_file_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                
-                sources_data = data.get('sources', [])
-                sources = []
+                with open(self.sources_file_path, 'rb') as f:
+                    data = yaml.load(f, Loader=YamlLoader)
                 
-                for item in sources_data:
-                    url = item.get('url', '').strip()
-                    if not url:
-                        continue
-                    
-                    name = item.get('name', '').strip()
-                    source_type_str = item.get('type', '').strip().lower()
-                    
-                    # Determine source type
-                    if source_type_str:
-                        try:
-                            source_type = SourceType(source_type_str)
-                        except ValueError:
-                            # Default to GITHUB_AWESOME_LIST if we can't parse the type
-                            source_type = SourceType.GITHUB_AWESOME_LIST if is_github_repo(url) else SourceType.WEBSITE
-                    else:
-                        # Auto-detect source type
-                        if is_github_repo(url):
-                            # Check if it looks like an awesome list (has "awesome" in the URL)
-                            if 'awesome' in url.lower():
-                                source_type = SourceType.GITHUB_AWESOME_LIST
-                            else:
-                                source_type = SourceType.GITHUB_REPOSITORY
-                        else:
-                            source_type = SourceType.WEBSITE
-                    
-                    # Generate name if not provided
-                    if not name:
-                        domain = extract_domain(url)
-                        name = f"MCP Tools ({domain})"
-                    
-                    # Create source
-                    source = Source(
-                        url=url,
-                        name=name,
-                        type=source_type,
-                        has_known_crawler=source_type in [SourceType.GITHUB_AWESOME_LIST, SourceType.GITHUB_REPOSITORY],
-                    )
-                    
-                    sources.append(source)
+                sources = parse_source_list(data.get('sources', []))
                 
                 logger.info(f"Loaded {len(sources)} sources from YAML file: {self.sources_file_path}")
                 
@@ -1209,5 +1421,3 @@ class SQLiteSourceStorage:
         
         # If all else fails, return empty list
         return []
-"""
-
@@ -19,6 +19,10 @@ DATA_DIR = os.getenv('DATA_DIR', str(Path(__file__).parents[3] / 'data'))
 SQLITE_DB_PATH = os.getenv('SQLITE_DB_PATH', str(Path(DATA_DIR) / 'mcp_tools.db'))
 TOOLS_FILE_PATH = os.getenv('TOOLS_FILE_PATH', str(Path(DATA_DIR) / 'tools.json'))
 SOURCES_FILE_PATH = os.getenv('SOURCES_FILE_PATH', str(Path(DATA_DIR) / 'sources.yaml'))
+# Number of backups kept per local tools/sources file (0 keeps all of them)
+LOCAL_BACKUP_COUNT = int(os.getenv('LOCAL_BACKUP_COUNT', '10'))
+# Seconds between WAL checkpoints of the SQLite database (0 disables them)
+SQLITE_CHECKPOINT_INTERVAL = int(os.getenv('SQLITE_CHECKPOINT_INTERVAL', '300'))
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -57,11 +61,13 @@ def get_config() -> Dict[str, Any]:
         "storage": {
             "sqlite": {
                 "db_path": SQLITE_DB_PATH,
+                "checkpoint_interval": SQLITE_CHECKPOINT_INTERVAL,
             },
             "local": {
                 "tools_file_path": TOOLS_FILE_PATH,
                 "sources_file_path": SOURCES_FILE_PATH,
                 "data_dir": DATA_DIR,
+                "backup_count": LOCAL_BACKUP_COUNT,
             },
         },
         "openai": {
@@ -82,5 +88,3 @@ def get_config() -> Dict[str, Any]:
             "file_path": LOG_FILE_PATH,
         },
     }
-"""
-
@@ -2,12 +2,28 @@
 Helper functions for the MCP Tool Crawler.
 """
 
+import json
+import os
 import re
 import uuid
 from datetime import datetime
-from typing import List, Set, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Set, Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from pydantic import ValidationError
+
+from ..models import Source, SourceType, KNOWN_CRAWLER_TYPES, SOURCE_TYPE_ALIASES
+
+# Prefer orjson's C serializer for JSON documents when it's installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches URLs that look like awesome lists
+_AWESOME_RE = re.compile(r'awesome', re.IGNORECASE)
+
 
 def generate_id(prefix: str = '') -> str:
     """
@@ -32,6 +48,46 @@ def get_timestamp() -> str:
     return datetime.utcnow().isoformat()
 
 
+def ensure_directory(directory: str) -> None:
+    """
+    Create a directory and its parents if they don't exist.
+    
+    Args:
+        directory: Directory to create.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+
+def dump_json(value: Any) -> bytes:
+    """
+    Serialize a value to compact JSON.
+    
+    Args:
+        value: Value to serialize.
+        
+    Returns:
+        The value as UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def load_json(data: Union[bytes, memoryview]) -> Any:
+    """
+    Deserialize UTF-8 encoded JSON.
+    
+    Args:
+        data: JSON document, as bytes or a view of a buffer such as a mapped file.
+        
+    Returns:
+        The deserialized value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
 def slugify(text: str) -> str:
     """
     Convert text to a URL-friendly slug.
@@ -53,6 +109,7 @@ def slugify(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
 def is_github_repo(url: str) -> bool:
     """
     Check if a URL is a GitHub repository.
@@ -69,8 +126,7 @@ def is_github_repo(url: str) -> bool:
             return False
         
         # Check if the path has at least owner/repo
-        path_parts = parsed_url.path.strip('/').split('/')
-        return len(path_parts) >= 2
+        return '/' in parsed_url.path.strip('/')
     except Exception:
         return False
 
@@ -90,7 +146,8 @@ def extract_github_repo_info(url: str) -> Optional[Dict[str, str]]:
         if parsed_url.netloc != 'github.com':
             return None
         
-        path_parts = parsed_url.path.strip('/').split('/')
+        # Only the owner and repo are needed, so stop splitting after them
+        path_parts = parsed_url.path.strip('/').split('/', 2)
         if len(path_parts) < 2:
             return None
         
@@ -102,6 +159,7 @@ def extract_github_repo_info(url: str) -> Optional[Dict[str, str]]:
         return None
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain from a URL.
@@ -119,6 +177,125 @@ def extract_domain(url: str) -> str:
         return ''
 
 
+@lru_cache(maxsize=4096)
+def _classify_url(url: str) -> Tuple[SourceType, str]:
+    """
+    Detect the source type and domain of a URL.
+    
+    Args:
+        url: URL of the source.
+        
+    Returns:
+        Tuple of the detected source type and the URL's domain.
+    """
+    # Parse the URL once for both the type and the domain
+    try:
+        parsed_url = urlparse(url)
+    except ValueError:
+        return SourceType.WEBSITE, ''
+    
+    domain = parsed_url.netloc
+    # GitHub URLs with at least an owner/repo path
+    if domain == 'github.com' and '/' in parsed_url.path.strip('/'):
+        if _AWESOME_RE.search(url):
+            return SourceType.GITHUB_AWESOME_LIST, domain
+        return SourceType.GITHUB_REPOSITORY, domain
+    return SourceType.WEBSITE, domain
+
+
+def classify_source(url: str, source_type: Optional[SourceType] = None,
+                    name: Optional[str] = None) -> Source:
+    """
+    Build a source for a URL, detecting its type and name if not given.
+    
+    Args:
+        url: URL of the source.
+        source_type: Optional source type. If not provided, will be detected.
+        name: Optional name for the source. If not provided, will be generated.
+        
+    Returns:
+        The classified source.
+    """
+    detected_type, domain = _classify_url(url)
+    
+    # Use the detected source type if not provided
+    if not source_type:
+        source_type = detected_type
+    
+    # Generate name if not provided
+    if not name:
+        name = f"MCP Tools ({domain})"
+    
+    return Source(
+        url=url,
+        name=name,
+        type=source_type,
+        has_known_crawler=source_type in KNOWN_CRAWLER_TYPES,
+    )
+
+
+def parse_source_list(sources_data: List[Dict[str, Any]]) -> List[Source]:
+    """
+    Build sources from the entries of a source list file.
+    
+    Entries that carry an 'id' were written by a save and are restored as
+    saved, keeping their ID and last-crawl fields. Entries with an 'id' that
+    don't validate as a saved source, e.g. hand-edited ones missing a field,
+    are classified like new entries but keep their ID.
+    
+    Args:
+        sources_data: Entries of the file's 'sources' list, each with a 'url' and
+            optional 'name' and 'type'.
+        
+    Returns:
+        Sources for the entries that have a URL, in file order.
+    """
+    sources = []
+    for item in sources_data:
+        source_id = item.get('id')
+        if source_id:
+            try:
+                sources.append(Source(**item))
+                continue
+            except ValidationError:
+                pass
+        
+        # Keys left empty in YAML load as None, so treat them like missing ones
+        url = (item.get('url') or '').strip()
+        if not url:
+            continue
+        
+        name = (item.get('name') or '').strip()
+        source_type_str = (item.get('type') or '').strip().lower()
+        
+        # Unknown or missing types fall back to auto-detection
+        source = classify_source(url, SOURCE_TYPE_ALIASES.get(source_type_str), name)
+        if isinstance(source_id, str):
+            source.id = source_id
+        sources.append(source)
+    
+    return sources
+
+
+def select_new_sources(candidates: List[Source], existing_urls: Set[str]) -> List[Source]:
+    """
+    Pick the candidate sources whose URLs aren't known yet.
+    
+    Args:
+        candidates: Candidate sources. For duplicate URLs the first one wins.
+        existing_urls: URLs of the sources already known.
+        
+    Returns:
+        New sources, in candidate order.
+    """
+    candidates_by_url: Dict[str, Source] = {}
+    for source in candidates:
+        candidates_by_url.setdefault(source.url, source)
+    
+    new_urls = candidates_by_url.keys() - existing_urls
+    return [source for url, source in candidates_by_url.items() if url in new_urls]
+
+
 def deduplicate_by_key(items: List[Dict], key: str) -> List[Dict]:
     """
     Remove duplicates from a list of dictionaries based on a key.
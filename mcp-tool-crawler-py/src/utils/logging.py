@@ -53,5 +53,3 @@ def get_logger(name: str = None) -> logging.Logger:
     if name:
         return logger.getChild(name)
     return logger
-"""
-
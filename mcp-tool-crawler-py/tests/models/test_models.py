@@ -21,6 +21,46 @@ class TestSource:
         assert source.type == source_data["type"]
         assert source.has_known_crawler == source_data["has_known_crawler"]
         assert source.id is not None  # Should generate an ID
+    
+    def test_source_from_row(self):
+        """Test building a Source from a database row."""
+        row = (
+            "source-123456",
+            "https://github.com/awesome-mcp/awesome-list",
+            "Awesome MCP List",
+            "github_awesome_list",
+            1,
+            None,
+            None,
+            None,
+            '{"stars": 10}',
+        )
+        
+        source = Source.from_row(row)
+        assert source.id == "source-123456"
+        assert source.type == SourceType.GITHUB_AWESOME_LIST
+        assert source.has_known_crawler is True
+        assert source.metadata == {"stars": 10}
+    
+    def test_source_from_row_empty_metadata(self):
+        """Test that empty metadata rows get their own empty dict."""
+        row = (
+            "source-123456",
+            "https://example.com/tools",
+            "Example Tools",
+            "website",
+            0,
+            None,
+            None,
+            None,
+            "{}",
+        )
+        
+        first = Source.from_row(row)
+        second = Source.from_row(row)
+        assert first.metadata == {}
+        first.metadata["stars"] = 10
+        assert second.metadata == {}
 
 class TestMCPTool:
     """Test the MCPTool model."""
@@ -42,6 +82,37 @@ class TestMCPTool:
         assert tool.id is not None  # Should generate an ID
         assert tool.first_discovered is not None
         assert tool.last_updated is not None
+    
+    def test_mcp_tool_from_row(self):
+        """Test building an MCPTool from a database row."""
+        row = (
+            "tool-123456",
+            "Example MCP Tool",
+            "An example MCP tool",
+            "https://github.com/example/mcp-tool",
+            "https://github.com/awesome-mcp/awesome-list",
+            "2024-01-01T00:00:00",
+            "2024-01-02T00:00:00",
+            None,
+        )
+        
+        tool = MCPTool.from_row(row)
+        assert tool.id == "tool-123456"
+        assert tool.url == "https://github.com/example/mcp-tool"
+        assert tool.last_updated == "2024-01-02T00:00:00"
+        assert tool.metadata == {}
+    
+    def test_mcp_tool_to_dict(self):
+        """Test that to_dict matches pydantic's JSON dump."""
+        tool = MCPTool(
+            name="Example MCP Tool",
+            url="https://github.com/example/mcp-tool",
+            description="An example MCP tool",
+            source_url="https://github.com/awesome-mcp/awesome-list",
+            metadata={"tags": ["mcp"]},
+        )
+        
+        assert tool.to_dict() == tool.model_dump(mode='json')
 
 class TestCrawlerStrategy:
     """Test the CrawlerStrategy model."""
@@ -63,6 +134,23 @@ class TestCrawlerStrategy:
         assert strategy.id is not None
         assert strategy.created is not None
         assert strategy.last_modified is not None
+    
+    def test_crawler_strategy_from_row(self):
+        """Test building a CrawlerStrategy from a database row."""
+        row = (
+            "crawler-123456",
+            "source-123456",
+            "website",
+            "def extract_tools(content):\n    return []",
+            "Extracts tools from a website",
+            "2024-01-01T00:00:00",
+            "2024-01-02T00:00:00",
+        )
+        
+        strategy = CrawlerStrategy.from_row(row)
+        assert strategy.id == "crawler-123456"
+        assert strategy.source_type == SourceType.WEBSITE
+        assert strategy.last_modified == "2024-01-02T00:00:00"
 
 class TestCrawlResult:
     """Test the CrawlResult model."""
@@ -87,4 +175,14 @@ class TestCrawlResult:
         assert result.updated_tools == result_data["updated_tools"]
         assert result.duration == result_data["duration"]
         assert result.error == result_data["error"]
-        assert result.timestamp is not None  # Should generate a timestamp
\ No newline at end of file
+        assert result.timestamp is not None  # Should generate a timestamp
+    
+    def test_crawl_result_from_row(self):
+        """Test building a CrawlResult from a database row."""
+        row = ("source-123456", "2024-01-01T00:00:00", 1, 10, 5, 2, 1500, None)
+        
+        result = CrawlResult.from_row(row)
+        assert result.source_id == "source-123456"
+        assert result.success is True
+        assert result.tools_discovered == 10
+        assert result.error is None
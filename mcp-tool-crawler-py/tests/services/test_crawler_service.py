@@ -0,0 +1,56 @@
+"""
+Unit tests for the CrawlerService class.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.models import Source, SourceType, CrawlResult
+from src.services import crawler_service
+from src.services.crawler_service import CrawlerService
+
+
+@pytest.fixture
+def sources():
+    """Create enough sources for several last-crawl batches."""
+    return [
+        Source(
+            url=f"https://example.com/tools-{i}",
+            name=f"Example Tools {i}",
+            type=SourceType.WEBSITE,
+            has_known_crawler=False,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crawl_all_sources_records_last_crawl_in_batches(sources, monkeypatch):
+    """Test that last-crawl updates are saved in bounded batches during the run."""
+    monkeypatch.setattr(crawler_service, 'LAST_CRAWL_BATCH_SIZE', 2)
+    
+    source_manager = MagicMock()
+    source_manager.get_sources_to_crawl = AsyncMock(return_value=sources)
+    source_manager.update_sources_last_crawl = AsyncMock(return_value=2)
+    
+    service = CrawlerService.__new__(CrawlerService)
+    service.source_manager = source_manager
+    
+    async def crawl_source(source, update_last_crawl=True):
+        return CrawlResult(
+            source_id=source.id,
+            success=True,
+            tools_discovered=0,
+            new_tools=0,
+            updated_tools=0,
+            duration=0,
+        )
+    
+    monkeypatch.setattr(service, 'crawl_source', crawl_source)
+    
+    results = await service.crawl_all_sources(concurrency=1)
+    
+    assert len(results) == len(sources)
+    batches = [call.args[0] for call in source_manager.update_sources_last_crawl.await_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [source_id for batch in batches for source_id, _ in batch] == [source.id for source in sources]
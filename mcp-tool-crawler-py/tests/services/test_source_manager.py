@@ -9,7 +9,9 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 from src.models import Source, SourceType
+from src.services import source_manager
 from src.services.source_manager import SourceManager
+from src.storage.local_storage import LocalSourceStorage
 from src.storage.sqlite_storage import SQLiteSourceStorage
 
 
@@ -61,16 +63,13 @@ def sample_sources():
 @pytest.fixture
 def mock_source_manager(monkeypatch, temp_db_path, temp_sources_file_path):
     """Create a mock SourceManager with a temporary database."""
-    # Mock the SQLiteSourceStorage to use our temporary paths
-    def mock_init(self):
-        self.db_path = temp_db_path
-        self.sources_file_path = temp_sources_file_path
-        self._ensure_db_exists()
-    
-    monkeypatch.setattr(SQLiteSourceStorage, "__init__", mock_init)
+    # Back the SourceManager with a SQLiteSourceStorage on our temporary paths
+    storage = SQLiteSourceStorage(temp_db_path, temp_sources_file_path)
+    monkeypatch.setattr(source_manager, "get_source_storage", lambda: storage)
     
     # Return a SourceManager instance
-    return SourceManager()
+    yield SourceManager()
+    storage.close()
 
 
 @pytest.mark.asyncio
@@ -92,6 +91,17 @@ async def test_add_source(mock_source_manager, sample_sources):
     assert all_sources[0].id == source.id
 
 
+@pytest.mark.asyncio
+async def test_get_source(mock_source_manager, sample_sources):
+    """Test getting a source by ID."""
+    await mock_source_manager.add_source(sample_sources[0])
+    
+    source = await mock_source_manager.get_source(sample_sources[0].id)
+    assert source is not None
+    assert source.url == sample_sources[0].url
+    assert await mock_source_manager.get_source("source-missing") is None
+
+
 @pytest.mark.asyncio
 async def test_add_source_by_url(mock_source_manager):
     """Test adding a source by URL."""
@@ -169,6 +179,54 @@ async def test_update_source_last_crawl(mock_source_manager, sample_sources):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_update_source_last_crawl_failed_save(mock_source_manager, sample_sources, monkeypatch):
+    """Test that a failed save leaves the stored source unchanged."""
+    source = sample_sources[0]
+    await mock_source_manager.add_source(source)
+    
+    async def failing_save_sources(sources):
+        return False
+    
+    monkeypatch.setattr(mock_source_manager.storage, "save_sources", failing_save_sources)
+    
+    assert await mock_source_manager.update_sources_last_crawl([(source.id, True)]) == 0
+    stored_source = await mock_source_manager.get_source(source.id)
+    assert stored_source.last_crawled is None
+    assert stored_source.last_crawl_status is None
+
+
+@pytest.mark.asyncio
+async def test_get_source_returns_copy(mock_source_manager, sample_sources):
+    """Test that changing a returned source doesn't change the stored one."""
+    source = sample_sources[0]
+    await mock_source_manager.add_source(source)
+    
+    returned_source = await mock_source_manager.get_source(source.id)
+    returned_source.name = "Renamed Source"
+    
+    assert (await mock_source_manager.get_source(source.id)).name == source.name
+
+
+@pytest.mark.asyncio
+async def test_sources_reload_when_source_list_changes(monkeypatch, tmp_path, sample_sources):
+    """Test that the source index is reloaded after another writer replaces the file."""
+    sources_file_path = str(tmp_path / "sources.yaml")
+    storage = LocalSourceStorage(sources_file_path)
+    monkeypatch.setattr(source_manager, "get_source_storage", lambda: storage)
+    manager = SourceManager()
+    
+    await manager.add_source(sample_sources[0])
+    assert len(await manager.get_all_sources()) == 1
+    
+    # Another process saves the source list
+    other_storage = LocalSourceStorage(sources_file_path)
+    assert await other_storage.save_sources(sample_sources) is True
+    
+    all_sources = await manager.get_all_sources()
+    assert {source.id for source in all_sources} == {source.id for source in sample_sources}
+
+
 @pytest.mark.asyncio
 async def test_initialize_sources(mock_source_manager, sample_sources, monkeypatch):
     """Test initializing sources."""
@@ -187,5 +245,21 @@ async def test_initialize_sources(mock_source_manager, sample_sources, monkeypat
         assert source.url == sample_sources[i].url
         assert source.name == sample_sources[i].name
         assert source.type == sample_sources[i].type
-"""
 
+
+@pytest.mark.asyncio
+async def test_initialize_sources_failed_save(mock_source_manager, sample_sources, monkeypatch):
+    """Test that sources that fail to save aren't returned as initialized."""
+    # The stored index is empty, and the source list holds the sample sources
+    loads = [[], sample_sources]
+    
+    async def mock_load_sources():
+        return loads.pop(0)
+    
+    async def failing_save_sources(sources):
+        return False
+    
+    monkeypatch.setattr(mock_source_manager.storage, "load_sources", mock_load_sources)
+    monkeypatch.setattr(mock_source_manager.storage, "save_sources", failing_save_sources)
+    
+    assert await mock_source_manager.initialize_sources() == []
@@ -0,0 +1,168 @@
+"""
+Unit tests for the SQLiteSourceManager class.
+"""
+
+import os
+import pytest
+import tempfile
+
+from src.models import Source, SourceType
+from src.services.sqlite_source_manager import SQLiteSourceManager
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create a temporary database file path."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+    
+    yield db_path
+    
+    # Clean up
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+@pytest.fixture
+def source_manager(temp_db_path):
+    """Create a SQLiteSourceManager with a temporary database."""
+    manager = SQLiteSourceManager(db_path=temp_db_path)
+    yield manager
+    manager.storage.close()
+
+
+@pytest.fixture
+def sample_source():
+    """Create a sample source for testing."""
+    return Source(
+        url="https://github.com/example/awesome-list",
+        name="Example Awesome List",
+        type=SourceType.GITHUB_AWESOME_LIST,
+        has_known_crawler=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_all_sources_is_cached(source_manager, sample_source, monkeypatch):
+    """Test that get_all_sources is served from the cache until a write."""
+    await source_manager.add_source(sample_source)
+    assert len(await source_manager.get_all_sources()) == 1
+    
+    calls = 0
+    original = source_manager.storage.get_all_sources
+    
+    async def counting_get_all_sources():
+        nonlocal calls
+        calls += 1
+        return await original()
+    
+    monkeypatch.setattr(source_manager.storage, "get_all_sources", counting_get_all_sources)
+    
+    # Served from the cache
+    sources = await source_manager.get_all_sources()
+    assert calls == 0
+    assert len(sources) == 1
+    
+    # Mutating the returned list doesn't touch the cache
+    sources.clear()
+    assert len(await source_manager.get_all_sources()) == 1
+    
+    # A write resets the cache
+    await source_manager.update_source_last_crawl(sample_source.id, success=True)
+    updated = await source_manager.get_all_sources()
+    assert calls == 1
+    assert updated[0].last_crawl_status == "success"
+
+
+@pytest.mark.asyncio
+async def test_get_all_sources_returns_copies(source_manager, sample_source):
+    """Test that changing a returned source doesn't change the cached one."""
+    await source_manager.add_source(sample_source)
+    
+    sources = await source_manager.get_all_sources()
+    sources[0].last_crawl_status = "failed"
+    
+    assert (await source_manager.get_all_sources())[0].last_crawl_status is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_sources_sees_writes_through_shared_storage(source_manager, temp_db_path, sample_source):
+    """Test that writes made by other holders of the shared storage reset the cache."""
+    await source_manager.add_source(sample_source)
+    assert (await source_manager.get_all_sources())[0].last_crawl_status is None
+    
+    other_manager = SQLiteSourceManager(db_path=temp_db_path)
+    assert other_manager.storage is source_manager.storage
+    await other_manager.update_source_last_crawl(sample_source.id, success=True)
+    
+    assert (await source_manager.get_all_sources())[0].last_crawl_status == "success"
+
+
+@pytest.mark.asyncio
+async def test_add_source_by_url_detects_type(source_manager):
+    """Test that add_source_by_url detects the type and name of a source."""
+    awesome = await source_manager.add_source_by_url("https://github.com/example/awesome-mcp")
+    repo = await source_manager.add_source_by_url("https://github.com/example/mcp-server")
+    website = await source_manager.add_source_by_url("https://example.com/tools")
+    
+    assert awesome.type == SourceType.GITHUB_AWESOME_LIST
+    assert awesome.has_known_crawler
+    assert repo.type == SourceType.GITHUB_REPOSITORY
+    assert repo.has_known_crawler
+    assert website.type == SourceType.WEBSITE
+    assert not website.has_known_crawler
+    assert website.name == "MCP Tools (example.com)"
+
+
+@pytest.mark.asyncio
+async def test_initialize_sources_skips_unchanged_source_list(source_manager, tmp_path, monkeypatch):
+    """Test that an unchanged source list file isn't parsed again."""
+    from src.services import sqlite_source_manager
+    from src.storage.local_storage import LocalStorage
+    
+    source_list = tmp_path / "sources.yaml"
+    source_list.write_text("sources:\n  - url: https://github.com/example/awesome-mcp\n")
+    monkeypatch.setitem(sqlite_source_manager.config, "source_list_path", str(source_list))
+    
+    sources = await source_manager.initialize_sources()
+    assert [s.url for s in sources] == ["https://github.com/example/awesome-mcp"]
+    
+    loads = 0
+    original = LocalStorage.load_sources
+    
+    async def counting_load_sources(self):
+        nonlocal loads
+        loads += 1
+        return await original(self)
+    
+    monkeypatch.setattr(LocalStorage, "load_sources", counting_load_sources)
+    
+    # Unchanged file is skipped
+    assert len(await source_manager.initialize_sources()) == 1
+    assert loads == 0
+    
+    # A modified file is ingested again
+    source_list.write_text(
+        "sources:\n"
+        "  - url: https://github.com/example/awesome-mcp\n"
+        "  - url: https://example.com/tools\n"
+    )
+    os.utime(source_list, ns=(0, source_list.stat().st_mtime_ns + 1))
+    assert len(await source_manager.initialize_sources()) == 2
+    assert loads == 1
+
+
+@pytest.mark.asyncio
+async def test_new_manager_after_storage_close(temp_db_path, sample_source):
+    """Test that a manager created after the shared storage is closed can still write."""
+    first = SQLiteSourceManager(db_path=temp_db_path)
+    assert SQLiteSourceManager(db_path=temp_db_path).storage is first.storage
+    first.storage.close()
+    
+    manager = SQLiteSourceManager(db_path=temp_db_path)
+    try:
+        assert manager.storage is not first.storage
+        await manager.add_source(sample_source)
+        assert [s.url for s in await manager.get_all_sources()] == [sample_source.url]
+    finally:
+        manager.storage.close()
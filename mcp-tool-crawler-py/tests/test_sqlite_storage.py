@@ -2,14 +2,18 @@
 Unit tests for SQLite storage implementation.
 """
 
+import asyncio
 import os
 import pytest
 import tempfile
+import time
 from pathlib import Path
 from datetime import datetime
 
 from src.models import MCPTool, Source, SourceType, CrawlerStrategy, CrawlResult
-from src.storage.sqlite_storage import SQLiteStorage
+from src import storage as storage_module
+from src.storage import get_sqlite_storage
+from src.storage.sqlite_storage import SQLiteStorage, SOURCE_INDEXES, BULK_INDEX_REBUILD_THRESHOLD
 
 
 @pytest.fixture
@@ -26,10 +30,24 @@ def temp_db_path():
 
 
 @pytest.fixture
-async def sqlite_storage(temp_db_path):
+def sqlite_storage(temp_db_path):
     """Create a SQLiteStorage instance with a temporary database."""
     storage = SQLiteStorage(temp_db_path)
     yield storage
+    storage.close()
+
+
+def test_get_sqlite_storage_shares_one_instance_per_database(tmp_path, monkeypatch):
+    """Test that the default path and other spellings of a path share one storage."""
+    db_path = tmp_path / "shared.db"
+    monkeypatch.setattr(storage_module, "DEFAULT_DB_PATH", db_path)
+    
+    storage = get_sqlite_storage()
+    try:
+        assert get_sqlite_storage(str(db_path)) is storage
+        assert get_sqlite_storage(str(tmp_path / "subdir" / ".." / "shared.db")) is storage
+    finally:
+        storage.close()
 
 
 @pytest.mark.asyncio
@@ -149,6 +167,174 @@ async def test_get_all_sources(sqlite_storage):
     assert len(all_sources) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_all_source_urls(sqlite_storage):
+    """Test getting the URLs of all sources."""
+    assert await sqlite_storage.get_all_source_urls() == set()
+    
+    source = Source(
+        url="https://github.com/example/awesome-mcp",
+        name="Awesome MCP",
+        type=SourceType.GITHUB_AWESOME_LIST,
+        has_known_crawler=True,
+    )
+    await sqlite_storage.save_source(source)
+    
+    assert await sqlite_storage.get_all_source_urls() == {source.url}
+
+
+@pytest.mark.asyncio
+async def test_save_sources_bulk(sqlite_storage):
+    """Test saving multiple sources in a single transaction."""
+    sources = [
+        Source(
+            url=f"https://github.com/example/mcp-tools-{i}",
+            name=f"MCP Tools {i}",
+            type=SourceType.GITHUB_REPOSITORY,
+            has_known_crawler=True,
+        )
+        for i in range(5)
+    ]
+    
+    result = await sqlite_storage.save_sources_bulk(sources)
+    assert result is True
+    
+    all_sources = await sqlite_storage.get_all_sources()
+    assert len(all_sources) == 5
+    
+    # Saving the same sources again replaces them instead of duplicating
+    sources[0].name = "Renamed MCP Tools"
+    result = await sqlite_storage.save_sources_bulk(sources)
+    assert result is True
+    
+    all_sources = await sqlite_storage.get_all_sources()
+    assert len(all_sources) == 5
+    renamed = await sqlite_storage.get_source(sources[0].id)
+    assert renamed.name == "Renamed MCP Tools"
+
+
+@pytest.mark.asyncio
+async def test_save_sources_bulk_updates_row_with_same_url(sqlite_storage):
+    """Test that a source with a stored URL but a new ID updates the stored row."""
+    stored = Source(
+        url="https://github.com/example/mcp-tools",
+        name="MCP Tools",
+        type=SourceType.GITHUB_REPOSITORY,
+        has_known_crawler=True,
+    )
+    assert await sqlite_storage.save_sources_bulk([stored]) is True
+    
+    renamed = Source(
+        url=stored.url,
+        name="Renamed MCP Tools",
+        type=SourceType.GITHUB_REPOSITORY,
+        has_known_crawler=True,
+    )
+    other = Source(
+        url="https://example.com/tools",
+        name="Example Tools",
+        type=SourceType.WEBSITE,
+        has_known_crawler=False,
+    )
+    assert await sqlite_storage.save_sources_bulk([renamed, other]) is True
+    
+    all_sources = await sqlite_storage.get_all_sources()
+    assert len(all_sources) == 2
+    updated = await sqlite_storage.get_source(stored.id)
+    assert updated.name == "Renamed MCP Tools"
+    assert await sqlite_storage.get_source(renamed.id) is None
+
+
+@pytest.mark.asyncio
+async def test_save_sources_bulk_keeps_crawl_results(sqlite_storage):
+    """Test that re-saving a source doesn't cascade-delete its crawl results."""
+    source = Source(
+        url="https://github.com/example/awesome-mcp",
+        name="Awesome MCP",
+        type=SourceType.GITHUB_AWESOME_LIST,
+        has_known_crawler=True,
+    )
+    await sqlite_storage.save_sources_bulk([source])
+    await sqlite_storage.save_crawl_result(CrawlResult(
+        source_id=source.id,
+        success=True,
+        tools_discovered=3,
+        new_tools=3,
+        updated_tools=0,
+        duration=100,
+    ))
+    
+    source.name = "Renamed Awesome MCP"
+    assert await sqlite_storage.save_sources_bulk([source]) is True
+    
+    assert (await sqlite_storage.get_source(source.id)).name == "Renamed Awesome MCP"
+    assert len(await sqlite_storage.get_crawl_results_by_source_id(source.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_save_sources_bulk_rebuilds_indexes(sqlite_storage):
+    """Test that a large bulk save leaves the source indexes in place."""
+    sources = [
+        Source(
+            url=f"https://example.com/source-{i}",
+            name=f"Source {i}",
+            type=SourceType.WEBSITE,
+            has_known_crawler=False,
+        )
+        for i in range(BULK_INDEX_REBUILD_THRESHOLD + 1)
+    ]
+    assert await sqlite_storage.save_sources_bulk(sources) is True
+    
+    with sqlite_storage.get_connection() as conn:
+        indexes = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        analyzed = {row[0] for row in conn.execute("SELECT idx FROM sqlite_stat1 WHERE tbl = 'sources'")}
+    assert set(SOURCE_INDEXES) <= indexes
+    assert set(SOURCE_INDEXES) <= analyzed
+    assert len(await sqlite_storage.get_all_source_urls()) == len(sources)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_truncates_wal(sqlite_storage, temp_db_path):
+    """Test that a checkpoint empties the WAL and that writes start the checkpoint task."""
+    source = Source(
+        url="https://example.com/tools",
+        name="Example Tools",
+        type=SourceType.WEBSITE,
+        has_known_crawler=False,
+    )
+    assert await sqlite_storage.save_sources_bulk([source]) is True
+    assert sqlite_storage._checkpoint_task is not None
+    assert os.path.getsize(f"{temp_db_path}-wal") > 0
+    
+    sqlite_storage.checkpoint()
+    assert os.path.getsize(f"{temp_db_path}-wal") == 0
+    assert await sqlite_storage.get_source(source.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_task_restarts_after_it_ends(sqlite_storage):
+    """Test that a write starts a new checkpoint task once the previous one has ended."""
+    source = Source(
+        url="https://example.com/tools",
+        name="Example Tools",
+        type=SourceType.WEBSITE,
+        has_known_crawler=False,
+    )
+    assert await sqlite_storage.save_sources_bulk([source]) is True
+    first_task = sqlite_storage._checkpoint_task
+    
+    # Ending the event loop of an asyncio.run cancels the task the same way
+    first_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first_task
+    
+    assert await sqlite_storage.save_sources_bulk([source]) is True
+    assert sqlite_storage._checkpoint_task is not first_task
+    assert not sqlite_storage._checkpoint_task.done()
+
+
 @pytest.mark.asyncio
 async def test_get_sources_to_crawl(sqlite_storage):
     """Test getting sources to crawl."""
@@ -193,6 +379,28 @@ async def test_get_sources_to_crawl(sqlite_storage):
     assert "https://github.com/example/new-repo" in urls
 
 
+@pytest.mark.asyncio
+async def test_get_sources_to_crawl_epoch_threshold(sqlite_storage):
+    """Test getting sources to crawl with an epoch threshold."""
+    source = Source(
+        url="https://github.com/example/awesome-mcp",
+        name="Awesome MCP",
+        type=SourceType.GITHUB_AWESOME_LIST,
+        has_known_crawler=True,
+    )
+    await sqlite_storage.save_source(source)
+    await sqlite_storage.update_source_last_crawl(source.id, True)
+    
+    now = int(time.time())
+    
+    # Crawled just now, so not due against a threshold an hour ago
+    assert await sqlite_storage.get_sources_to_crawl(now - 3600) == []
+    
+    # But due against a threshold an hour from now
+    sources_to_crawl = await sqlite_storage.get_sources_to_crawl(now + 3600)
+    assert [s.id for s in sources_to_crawl] == [source.id]
+
+
 @pytest.mark.asyncio
 async def test_update_source_last_crawl(sqlite_storage):
     """Test updating a source's last crawl information."""
@@ -224,6 +432,36 @@ async def test_update_source_last_crawl(sqlite_storage):
     assert updated_source.last_crawl_status == "failed"
 
 
+@pytest.mark.asyncio
+async def test_update_sources_last_crawl(sqlite_storage):
+    """Test updating the last crawl information of several sources at once."""
+    sources = [
+        Source(
+            url=f"https://github.com/example/repo-{i}",
+            name=f"Repo {i}",
+            type=SourceType.GITHUB_REPOSITORY,
+            has_known_crawler=True,
+        )
+        for i in range(3)
+    ]
+    assert await sqlite_storage.save_sources_bulk(sources) is True
+    
+    updated = await sqlite_storage.update_sources_last_crawl([
+        (sources[0].id, True),
+        (sources[1].id, False),
+        ("source-missing", True),
+    ])
+    assert updated == 2
+    
+    first = await sqlite_storage.get_source(sources[0].id)
+    second = await sqlite_storage.get_source(sources[1].id)
+    third = await sqlite_storage.get_source(sources[2].id)
+    assert first.last_crawl_status == "success"
+    assert second.last_crawl_status == "failed"
+    assert first.last_crawled == second.last_crawled
+    assert third.last_crawled is None
+
+
 @pytest.mark.asyncio
 async def test_delete_source(sqlite_storage):
     """Test deleting a source."""
@@ -337,3 +575,48 @@ async def test_save_and_get_crawl_result(sqlite_storage):
     assert latest_result.success is False
     assert latest_result.error == "Test error"
 
+
+
+@pytest.mark.asyncio
+async def test_crawl_results_lookup_uses_index(sqlite_storage):
+    """Test that crawl results by source are read in order from the composite index."""
+    with sqlite_storage.get_connection() as conn:
+        plan = " ".join(
+            row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM crawl_results WHERE source_id = ? ORDER BY timestamp DESC LIMIT ?",
+                ("source-id", 10),
+            )
+        )
+    assert "idx_crawl_results_source_id_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_get_crawl_results_by_source_id_pages(sqlite_storage):
+    """Test paging through crawl results with the before timestamp."""
+    source = Source(
+        url="https://github.com/example/awesome-mcp",
+        name="Awesome MCP",
+        type=SourceType.GITHUB_AWESOME_LIST,
+        has_known_crawler=True,
+    )
+    await sqlite_storage.save_source(source)
+    
+    for day in range(1, 6):
+        await sqlite_storage.save_crawl_result(CrawlResult(
+            source_id=source.id,
+            timestamp=f"2024-01-0{day}T00:00:00",
+            success=True,
+            tools_discovered=day,
+            new_tools=0,
+            updated_tools=0,
+            duration=100,
+        ))
+    
+    first_page = await sqlite_storage.get_crawl_results_by_source_id(source.id, limit=2)
+    assert [r.tools_discovered for r in first_page] == [5, 4]
+    
+    second_page = await sqlite_storage.get_crawl_results_by_source_id(
+        source.id, limit=2, before=first_page[-1].timestamp
+    )
+    assert [r.tools_discovered for r in second_page] == [3, 2]
@@ -85,7 +85,8 @@ class TestLocalStorage:
         # Save a tool
         await storage.save_tools([mock_tool])
         
-        # Save again to trigger backup
+        # Save a changed catalog to trigger backup
+        mock_tool.description = "An updated test tool"
         await storage.save_tools([mock_tool])
         
         # Check if backup directory exists and contains a file
@@ -94,6 +95,52 @@ class TestLocalStorage:
         backup_files = list(backup_dir.glob("tools_*.json"))
         assert len(backup_files) > 0
 
+    @pytest.mark.asyncio
+    async def test_unchanged_save_is_skipped(self, temp_dir, mock_tool):
+        """Test that saving an unchanged catalog doesn't rewrite the file."""
+        file_path = os.path.join(temp_dir, "tools.json")
+        storage = LocalStorage(file_path)
+        
+        assert await storage.save_tools([mock_tool]) is True
+        inode = os.stat(file_path).st_ino
+        
+        # Same catalog: no new file and no backup
+        assert await storage.save_tools([mock_tool]) is True
+        assert os.stat(file_path).st_ino == inode
+        backup_dir = Path(file_path).parent / 'backups' / 'tools'
+        assert list(backup_dir.glob("tools_*.json")) == []
+        
+        # A file changed behind the storage's back is written again
+        with open(file_path, 'w') as f:
+            f.write("[]")
+        assert await storage.save_tools([mock_tool]) is True
+        assert len(await storage.load_tools()) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_sources_uses_parse_cache(self, temp_dir):
+        """Test that an unchanged source list is read from its JSON cache."""
+        source_list_path = os.path.join(temp_dir, "sources.yaml")
+        with open(source_list_path, "w") as f:
+            f.write("sources:\n  - url: https://github.com/example/awesome-mcp\n")
+        
+        storage = LocalStorage(os.path.join(temp_dir, "tools.json"), source_list_path)
+        first_sources = await storage.load_sources()
+        assert len(first_sources) == 1
+        assert os.path.exists(source_list_path + ".cache.json")
+        
+        # Unchanged file: neither the YAML nor the source entries are parsed again
+        with patch('src.storage.local_storage.yaml.load', side_effect=AssertionError), \
+                patch('src.storage.local_storage.parse_source_list', side_effect=AssertionError):
+            sources = await storage.load_sources()
+        assert [s.url for s in sources] == ["https://github.com/example/awesome-mcp"]
+        assert sources[0].id == first_sources[0].id
+        assert sources[0].type == SourceType.GITHUB_AWESOME_LIST
+        
+        # A changed file is parsed again
+        with open(source_list_path, "a") as f:
+            f.write("  - url: https://example.com/tools\n")
+        assert len(await storage.load_sources()) == 2
+
     @pytest.mark.asyncio
     async def test_recovery_from_backup(self, temp_dir, mock_tool):
         """Test recovery from backup when the main file is corrupted."""
@@ -160,6 +207,85 @@ class TestLocalSourceStorage:
         assert loaded_sources[0].type == mock_source.type
         assert loaded_sources[0].has_known_crawler == mock_source.has_known_crawler
 
+    @pytest.mark.asyncio
+    async def test_load_sources_missing_file(self, temp_dir):
+        """Test that a missing source file loads as an empty list."""
+        storage = LocalSourceStorage(os.path.join(temp_dir, "missing.yaml"))
+        
+        assert await storage.load_sources() == []
+
+    @pytest.mark.asyncio
+    async def test_load_sources_uses_parse_cache(self, temp_dir, mock_source):
+        """Test that a new instance reads an unchanged source list from its JSON cache."""
+        file_path = os.path.join(temp_dir, "sources.yaml")
+        await LocalSourceStorage(file_path).save_sources([mock_source])
+        await LocalSourceStorage(file_path).load_sources()
+
+        with patch('src.storage.local_storage.yaml.load', side_effect=AssertionError), \
+                patch('src.storage.local_storage.parse_source_list', side_effect=AssertionError):
+            loaded_sources = await LocalSourceStorage(file_path).load_sources()
+
+        assert len(loaded_sources) == 1
+        assert loaded_sources[0].id == mock_source.id
+        assert loaded_sources[0].type == mock_source.type
+
+    @pytest.mark.asyncio
+    async def test_load_sources_type_aliases(self, temp_dir):
+        """Test that short type aliases are accepted in the source file."""
+        file_path = os.path.join(temp_dir, "sources.yaml")
+        with open(file_path, "w") as f:
+            yaml.dump({"sources": [
+                {"url": "https://github.com/example/mcp-tools", "type": "awesome"},
+                {"url": "https://github.com/example/mcp-server", "type": "repo"},
+                {"url": "https://example.com/tools", "type": "site"},
+            ]}, f)
+        
+        storage = LocalSourceStorage(file_path)
+        loaded_sources = await storage.load_sources()
+        
+        assert [s.type for s in loaded_sources] == [
+            SourceType.GITHUB_AWESOME_LIST,
+            SourceType.GITHUB_REPOSITORY,
+            SourceType.WEBSITE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_load_sources_hand_edited_entry_with_id(self, temp_dir, mock_source):
+        """Test that an entry with an ID but missing saved fields is classified, not dropped."""
+        file_path = os.path.join(temp_dir, "sources.yaml")
+        with open(file_path, "w") as f:
+            yaml.dump({"sources": [
+                mock_source.model_dump(mode='json'),
+                {"id": "source-edited", "url": "https://github.com/example/mcp-server", "name": "Edited"},
+            ]}, f)
+        
+        loaded_sources = await LocalSourceStorage(file_path).load_sources()
+        
+        assert [s.id for s in loaded_sources] == [mock_source.id, "source-edited"]
+        assert loaded_sources[1].name == "Edited"
+        assert loaded_sources[1].type == SourceType.GITHUB_REPOSITORY
+        assert loaded_sources[1].has_known_crawler is True
+
+    @pytest.mark.asyncio
+    async def test_load_sources_empty_fields(self, temp_dir):
+        """Test that entries with empty name or type keys are still loaded."""
+        file_path = os.path.join(temp_dir, "sources.yaml")
+        with open(file_path, "w") as f:
+            f.write(
+                "sources:\n"
+                "  - url: https://example.com/tools\n"
+                "    name:\n"
+                "    type:\n"
+                "  - url:\n"
+            )
+        
+        storage = LocalSourceStorage(file_path)
+        loaded_sources = await storage.load_sources()
+        
+        assert len(loaded_sources) == 1
+        assert loaded_sources[0].name == "MCP Tools (example.com)"
+        assert loaded_sources[0].type == SourceType.WEBSITE
+
     @pytest.mark.asyncio
     async def test_backup_creation_for_sources(self, temp_dir, mock_source):
         """Test that backups are created when saving sources."""